@@ -17,6 +17,9 @@ from __future__ import annotations
 
 import argparse
 from dataclasses import dataclass
+import hashlib
+import mmap
+import os
 from pathlib import Path
 import re
 import sys
@@ -32,41 +35,75 @@ AGENTS_DIR = PROJECT_ROOT / "src" / "agents"
 PLACEHOLDER_RE = re.compile(r"(?<!\{)\{[A-Za-z_][A-Za-z0-9_]*\}(?!\})")
 
 
+def _file_digest(path: Path) -> bytes:
+    """Fast content digest; byte-identical files are structurally identical."""
+    digest = hashlib.blake2b(digest_size=16, usedforsecurity=False)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
 def _load_yaml(path: Path) -> Any:
-    with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    # mmap avoids the userspace read() copy; empty files cannot be mapped
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return {}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return yaml.safe_load(mm) or {}
 
 
 def _iter_yaml_files(root: Path) -> Iterable[Path]:
+    # scandir caches the dirent type, so is_dir/is_file don't re-stat the
+    # way rglob + p.is_file() do on every entry
     if not root.exists():
         return []
-    return sorted([p for p in root.rglob("*.yaml") if p.is_file()])
-
-
-def _get_placeholders(value: Any) -> set[str]:
-    found: set[str] = set()
+    out: list[Path] = []
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".yaml") and entry.is_file(follow_symlinks=False):
+                    out.append(Path(entry.path))
+    out.sort()
+    return out
+
+
+def _get_placeholders(value: Any, found: set[str] | None = None) -> set[str]:
+    # One shared set threaded down the recursion: no temporary set per
+    # leaf and no per-level merges
+    if found is None:
+        found = set()
     if isinstance(value, str):
-        found |= set(PLACEHOLDER_RE.findall(value))
+        # Cheap C-level gate: skip the regex for brace-free prose
+        if "{" in value:
+            for m in PLACEHOLDER_RE.finditer(value):
+                found.add(sys.intern(m.group()))
     elif isinstance(value, dict):
         for v in value.values():
-            found |= _get_placeholders(v)
+            _get_placeholders(v, found)
     elif isinstance(value, list):
         for v in value:
-            found |= _get_placeholders(v)
+            _get_placeholders(v, found)
     return found
 
 
-def _collect_keys(value: Any, prefix: str = "") -> set[str]:
+def _collect_keys(value: Any, prefix: str = "", keys: set[str] | None = None) -> set[str]:
     """
     Collect dotted key paths for all dict nodes.
     Leaves (non-dict) are also included as paths.
     """
-    keys: set[str] = set()
+    if keys is None:
+        keys = set()
     if isinstance(value, dict):
         for k, v in value.items():
-            path = f"{prefix}.{k}" if prefix else str(k)
+            # Interned: the same dotted paths recur across languages
+            path = sys.intern(f"{prefix}.{k}" if prefix else str(k))
             keys.add(path)
-            keys |= _collect_keys(v, path)
+            _collect_keys(v, path, keys)
     elif isinstance(value, list):
         # Lists: we don't expand indices; still consider it a leaf container.
         if prefix:
@@ -92,11 +129,23 @@ def _diff(en_obj: Any, zh_obj: Any) -> Diff:
     en_ph = _get_placeholders(en_obj)
     zh_ph = _get_placeholders(zh_obj)
 
+    # Equality first: equal sets skip the difference-set constructions
+    if en_keys != zh_keys:
+        missing_zh = sorted(en_keys - zh_keys)
+        extra_zh = sorted(zh_keys - en_keys)
+    else:
+        missing_zh = extra_zh = []
+    if en_ph != zh_ph:
+        placeholder_missing_zh = sorted(en_ph - zh_ph)
+        placeholder_extra_zh = sorted(zh_ph - en_ph)
+    else:
+        placeholder_missing_zh = placeholder_extra_zh = []
+
     return Diff(
-        missing_zh=sorted(en_keys - zh_keys),
-        extra_zh=sorted(zh_keys - en_keys),
-        placeholder_missing_zh=sorted(en_ph - zh_ph),
-        placeholder_extra_zh=sorted(zh_ph - en_ph),
+        missing_zh=missing_zh,
+        extra_zh=extra_zh,
+        placeholder_missing_zh=placeholder_missing_zh,
+        placeholder_extra_zh=placeholder_extra_zh,
     )
 
 
@@ -140,6 +189,10 @@ def main() -> int:
                     print(f"[MISSING {lang_name}] {module_dir.name}: {rel.as_posix()}")
                     continue
 
+                # Byte-identical files can't have drift: skip the parse
+                if _file_digest(en_file) == _file_digest(zh_file):
+                    continue
+
                 zh_obj = _load_yaml(zh_file)
                 d = _diff(en_obj, zh_obj)
 
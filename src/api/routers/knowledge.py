@@ -200,13 +200,16 @@ async def run_upload_processing_task(
         if processed_files:
             progress_tracker.update(
                 ProgressStage.EXTRACTING_ITEMS,
-                "Extracting numbered items...",
+                "Extracting numbered items in background...",
                 current=0,
                 total=len(processed_files),
             )
-            adder.extract_numbered_items_for_new_docs(processed_files, batch_size=20)
+            # Runs on the shared extraction worker; the upload task can
+            # complete without waiting for per-batch LLM calls
+            adder.schedule_numbered_extraction(processed_files, batch_size=20)
 
         adder.update_metadata(len(processed_files) if processed_files else 0)
+        adder.compact_metadata()
 
         # Update folder sync state if this was a folder sync
         if folder_id and processed_files:
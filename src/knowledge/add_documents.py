@@ -12,8 +12,8 @@ Supports multiple RAG providers with lazy loading:
 - raganything_docling: Multimodal with Docling parser
 """
 
-import argparse
 import asyncio
+import concurrent.futures
 from datetime import datetime
 from functools import partial
 import hashlib
@@ -23,9 +23,13 @@ from pathlib import Path
 import shutil
 import sys
 import tempfile
+import threading
 from typing import Any, Dict, List
 
-from dotenv import load_dotenv
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
 
 from src.knowledge.extract_numbered_items import process_content_list
 from src.logging import LightRAGLogContext, get_logger
@@ -36,11 +40,103 @@ from src.services.llm import get_llm_config
 from src.services.llm.config import get_llm_config as _early_config_load  # noqa: F401
 
 logger = get_logger("KnowledgeInit")
+# The constructor lives in _hashlib when OpenSSL (and its SHA-NI path)
+# backs sha256, and in _sha256 for the slow built-in fallback
+logger.debug(
+    f"hashlib sha256 backend: {hashlib.sha256.__name__} ({hashlib.sha256.__module__})"
+)
 
 # Default base directory for knowledge bases
 DEFAULT_BASE_DIR = "./data/knowledge_bases"
 
 
+def _read_json(path) -> Any:
+    """Parse a JSON file, using orjson when installed."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _ensure_raganything_path():
+    """Add the sibling RAG-Anything checkout to sys.path if present."""
+    project_root = Path(__file__).resolve().parent.parent.parent
+    raganything_path = project_root.parent / "raganything" / "RAG-Anything"
+    if raganything_path.exists() and str(raganything_path) not in sys.path:
+        sys.path.insert(0, str(raganything_path))
+
+
+# Pre-warmed provider modules, keyed by provider name. Populated by a
+# background thread at import time when KB_PREWARM_PROVIDER is set, so a
+# warm server does not pay the first ingest's import cost (hundreds of ms
+# for raganything/lightrag/llama_index) on the event loop thread.
+_PROVIDER_MODULES: Dict[str, Dict[str, Any]] = {}
+
+
+def _prewarm_provider_modules(provider: str):
+    try:
+        if provider == "llamaindex":
+            from src.services.rag.pipelines.llamaindex import LlamaIndexPipeline
+
+            _PROVIDER_MODULES[provider] = {"LlamaIndexPipeline": LlamaIndexPipeline}
+        elif provider == "lightrag":
+            from lightrag import LightRAG
+            from lightrag.utils import EmbeddingFunc
+
+            _PROVIDER_MODULES[provider] = {
+                "LightRAG": LightRAG,
+                "EmbeddingFunc": EmbeddingFunc,
+            }
+        elif provider in ("raganything", "raganything_docling"):
+            _ensure_raganything_path()
+            from lightrag.utils import EmbeddingFunc
+            from raganything import RAGAnything, RAGAnythingConfig
+
+            _PROVIDER_MODULES[provider] = {
+                "RAGAnything": RAGAnything,
+                "RAGAnythingConfig": RAGAnythingConfig,
+                "EmbeddingFunc": EmbeddingFunc,
+            }
+        else:
+            logger.warning(f"Unknown KB_PREWARM_PROVIDER '{provider}', nothing to pre-warm")
+            return
+        logger.info(f"Pre-warmed provider modules: {provider}")
+    except ImportError as e:
+        # Keep the lazy-import contract: pre-warm is best-effort, the
+        # provider methods still import (and report errors) on demand
+        logger.debug(f"Provider pre-warm skipped ({provider}): {e}")
+
+
+# Shared thread pool for filesystem work (hash, copy, rmtree). One
+# module-level pool serves every DocumentAdder - adders are created per
+# upload request, and per-instance pools relied on __del__ and piled up
+# idle threads under GC pressure. Also keeps the event loop's default
+# executor free for other asyncio users.
+_io_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=min(16, (os.cpu_count() or 4) * 4),
+    thread_name_prefix="kb-io",
+)
+
+# Single-threaded background pool for numbered-item extraction. Extraction
+# calls the LLM per batch and can take minutes; it must not hold up
+# process_new_documents' return to the caller. One worker serializes
+# extraction across uploads so concurrent merges never race on
+# numbered_items.json.
+_extraction_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="kb-extract"
+)
+
+_prewarm_provider = os.getenv("KB_PREWARM_PROVIDER")
+if _prewarm_provider:
+    threading.Thread(
+        target=_prewarm_provider_modules,
+        args=(_prewarm_provider,),
+        name="kb-prewarm",
+        daemon=True,
+    ).start()
+
+
 class DocumentAdder:
     """Add documents to existing knowledge base with Hash-validation.
 
@@ -51,6 +147,29 @@ class DocumentAdder:
     - raganything_docling: Imports raganything with Docling parser
     """
 
+    # No per-instance __dict__: adders are created per upload request and
+    # the attribute set is fixed
+    __slots__ = (
+        "kb_name",
+        "base_dir",
+        "kb_dir",
+        "raw_dir",
+        "images_dir",
+        "rag_storage_dir",
+        "content_list_dir",
+        "metadata_file",
+        "history_file",
+        "api_key",
+        "base_url",
+        "progress_tracker",
+        "llm_cfg",
+        "_hash_cache",
+        "_ingest_concurrency",
+        "_resolved_provider",
+        "_processor",
+        "_pending_hashes",
+    )
+
     def __init__(
         self,
         kb_name: str,
@@ -59,6 +178,7 @@ class DocumentAdder:
         base_url: str | None = None,
         progress_tracker=None,
         rag_provider: str | None = None,
+        ingest_concurrency: int | None = None,
     ):
         self.kb_name = kb_name
         self.base_dir = Path(base_dir)
@@ -72,6 +192,9 @@ class DocumentAdder:
         self.rag_storage_dir = self.kb_dir / "rag_storage"
         self.content_list_dir = self.kb_dir / "content_list"
         self.metadata_file = self.kb_dir / "metadata.json"
+        # Append-only update history lives beside metadata.json so the
+        # per-update write cost stays O(1) no matter how old the KB is
+        self.history_file = self.kb_dir / "update_history.jsonl"
 
         # For llamaindex, check llamaindex_storage instead of rag_storage
         provider = self._get_provider_from_metadata()
@@ -87,6 +210,20 @@ class DocumentAdder:
         self.base_url = base_url
         self.progress_tracker = progress_tracker
 
+        # Memo of staged path -> content hash, filled during add_documents()
+        # so later phases never have to re-read files just to re-derive it
+        self._hash_cache: Dict[str, str] = {}
+
+        # Buffer of filename -> hash while a batch is open; None outside
+        # begin_batch()/flush_batch()
+        self._pending_hashes: Dict[str, str] | None = None
+
+        # Bound for overlapping I/O-bound per-file ingestion (embedding and
+        # index API calls); parser-heavy work stays sequential
+        self._ingest_concurrency = ingest_concurrency or int(
+            os.getenv("INGEST_CONCURRENCY", "8")
+        )
+
         # IMPORTANT: rag_provider parameter is IGNORED for incremental add
         # We always use the provider from KB metadata to ensure consistency
         # This prevents mixing different index formats in the same KB
@@ -97,6 +234,19 @@ class DocumentAdder:
                 f"Using KB's existing provider '{provider}' for consistency."
             )
         logger.info(f"Incremental add will use provider: {provider} (from KB metadata)")
+
+        # Resolve the provider-specific processor once; process_new_documents
+        # then dispatches without re-checking the provider on every call
+        processors = {
+            "llamaindex": self._process_llamaindex,
+            "lightrag": self._process_lightrag,
+            "raganything": partial(self._process_raganything, parser="mineru"),
+            "raganything_docling": partial(self._process_raganything, parser="docling"),
+        }
+        if provider not in processors:
+            raise ValueError(f"Unknown RAG provider: {provider}")
+        self._processor = processors[provider]
+
         self._ensure_working_directories()
 
     def _get_provider_from_metadata(self) -> str:
@@ -107,16 +257,19 @@ class DocumentAdder:
         the same provider that was used during initialization to ensure
         data consistency and correct storage format.
 
+        Called exactly once, from __init__; everything after construction
+        reads the precomputed self._resolved_provider instead of re-deriving
+        it (and re-parsing metadata.json) per update.
+
         Returns:
             Provider name (llamaindex, lightrag, raganything, raganything_docling)
         """
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, "r", encoding="utf-8") as f:
-                    metadata = json.load(f)
-                    provider = metadata.get("rag_provider")
-                    if provider:
-                        return provider
+                metadata = _read_json(self.metadata_file)
+                provider = metadata.get("rag_provider")
+                if provider:
+                    return provider
             except Exception as e:
                 logger.warning(f"Failed to read provider from metadata: {e}")
 
@@ -130,14 +283,17 @@ class DocumentAdder:
 
     def _ensure_working_directories(self):
         for directory in [self.raw_dir, self.images_dir, self.content_list_dir]:
-            directory.mkdir(parents=True, exist_ok=True)
+            os.makedirs(directory, exist_ok=True)
 
     def _get_file_hash(self, file_path: Path) -> str:
         """
         Calculate SHA-256 hash of a file.
         Uses 64KB chunks for better throughput on SSDs.
         """
-        sha256_hash = hashlib.sha256()
+        # usedforsecurity=False: this is a content fingerprint, not a
+        # security boundary, and it lets OpenSSL pick the fastest
+        # (SHA-NI-accelerated) implementation on builds that gate it
+        sha256_hash = hashlib.sha256(usedforsecurity=False)
         chunk_size = 65536  # 64KB
         with open(file_path, "rb") as f:
             for byte_block in iter(lambda: f.read(chunk_size), b""):
@@ -148,16 +304,15 @@ class DocumentAdder:
         """Get map of filename -> hash from metadata."""
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    return data.get("file_hashes", {})
+                data = _read_json(self.metadata_file)
+                return data.get("file_hashes", {})
             except Exception:
                 return {}
         return {}
 
     async def _run_in_executor(self, func, *args, **kwargs):
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+        return await loop.run_in_executor(_io_executor, partial(func, *args, **kwargs))
 
     def add_documents(self, source_files: List[str], allow_duplicates: bool = False) -> List[Path]:
         """
@@ -188,9 +343,25 @@ class DocumentAdder:
 
             should_copy = True
             if dest_path.exists():
-                # If file exists in raw, check if it's the same content
-                dest_hash = self._get_file_hash(dest_path)
-                if dest_hash == current_hash:
+                # If file exists in raw, check if it's the same content.
+                # Cheap pre-check first: files staged by shutil.copy2 preserve
+                # size and mtime, so a (size, mtime) match means identical
+                # content without re-reading either file. A size mismatch means
+                # different content; only hash when size matches but mtime
+                # differs (the genuinely ambiguous case).
+                source_stat = source_path.stat()
+                dest_stat = dest_path.stat()
+                if (
+                    source_stat.st_size == dest_stat.st_size
+                    and source_stat.st_mtime_ns == dest_stat.st_mtime_ns
+                ):
+                    same_content = True
+                elif source_stat.st_size != dest_stat.st_size:
+                    same_content = False
+                else:
+                    same_content = self._get_file_hash(dest_path) == current_hash
+
+                if same_content:
                     should_copy = False
                     logger.info(f"  ⚠ Recovering staged file (interrupted run): {source_path.name}")
                 else:
@@ -207,6 +378,7 @@ class DocumentAdder:
                 shutil.copy2(source_path, dest_path)
                 logger.info(f"  ✓ Staged to raw: {source_path.name}")
 
+            self._hash_cache[str(dest_path)] = current_hash
             files_to_process.append(dest_path)
 
         return files_to_process
@@ -224,20 +396,49 @@ class DocumentAdder:
         if not new_files:
             return None
 
-        provider = self._resolved_provider
-        logger.info(f"Processing {len(new_files)} files with provider: {provider}")
+        # Within-batch dedup: the same content re-uploaded under different
+        # names should only pay the parse/embed cost once. Group files by
+        # content hash, process one canonical file per group, then record
+        # every duplicate name against the same hash on success.
+        unique_files: List[Path] = []
+        batch_duplicates: Dict[str, List[Path]] = {}
+        seen_hashes: Dict[str, Path] = {}
+        for doc_file in new_files:
+            file_hash = self._hash_cache.get(str(doc_file))
+            if file_hash is None:
+                file_hash = self._get_file_hash(doc_file)
+                self._hash_cache[str(doc_file)] = file_hash
+            canonical = seen_hashes.get(file_hash)
+            if canonical is None:
+                seen_hashes[file_hash] = doc_file
+                unique_files.append(doc_file)
+            else:
+                batch_duplicates.setdefault(str(canonical), []).append(doc_file)
+                logger.info(
+                    f"  → Deduplicated within batch: {doc_file.name} "
+                    f"(same content as {canonical.name})"
+                )
 
-        # Dispatch to provider-specific implementation
-        if provider == "llamaindex":
-            return await self._process_llamaindex(new_files)
-        elif provider == "lightrag":
-            return await self._process_lightrag(new_files)
-        elif provider == "raganything":
-            return await self._process_raganything(new_files, parser="mineru")
-        elif provider == "raganything_docling":
-            return await self._process_raganything(new_files, parser="docling")
-        else:
-            raise ValueError(f"Unknown RAG provider: {provider}")
+        logger.info(
+            f"Processing {len(unique_files)} files with provider: {self._resolved_provider}"
+        )
+
+        # Per-file hash updates buffer into one metadata flush (and fsync)
+        # for the whole batch
+        self.begin_batch()
+        try:
+            # Dispatch to the processor resolved at __init__ time
+            processed_files = await self._processor(unique_files)
+
+            # Canonize duplicate filenames whose content was just ingested
+            if processed_files:
+                for doc_file in processed_files:
+                    for duplicate in batch_duplicates.get(str(doc_file), []):
+                        self._record_successful_hash(duplicate)
+        finally:
+            self.flush_batch()
+
+        return processed_files
 
     async def _process_llamaindex(self, new_files: List[Path]) -> List[Path]:
         """
@@ -246,14 +447,18 @@ class DocumentAdder:
         """
         logger.info("Using LlamaIndex incremental add...")
 
-        # Lazy import llama_index
-        try:
-            from src.services.rag.pipelines.llamaindex import LlamaIndexPipeline
-        except ImportError as e:
-            raise ImportError(
-                f"LlamaIndex dependencies not installed. "
-                f"Install with: pip install llama-index llama-index-core. Error: {e}"
-            ) from e
+        # Lazy import llama_index (pre-warmed copy wins if available)
+        warmed = _PROVIDER_MODULES.get("llamaindex")
+        if warmed:
+            LlamaIndexPipeline = warmed["LlamaIndexPipeline"]
+        else:
+            try:
+                from src.services.rag.pipelines.llamaindex import LlamaIndexPipeline
+            except ImportError as e:
+                raise ImportError(
+                    f"LlamaIndex dependencies not installed. "
+                    f"Install with: pip install llama-index llama-index-core. Error: {e}"
+                ) from e
 
         # Pre-import progress stage if needed
         ProgressStage: Any = None
@@ -263,33 +468,90 @@ class DocumentAdder:
         pipeline = LlamaIndexPipeline(kb_base_dir=str(self.base_dir))
         file_paths = [str(f) for f in new_files]
 
-        # Use the new add_documents method for incremental add
-        processed_files = []
+        # Use the new add_documents method for incremental add, overlapping
+        # files up to the ingest concurrency bound
         total_files = len(file_paths)
+        semaphore = asyncio.Semaphore(self._ingest_concurrency)
+        completed = 0
 
-        for idx, file_path in enumerate(file_paths, 1):
+        async def _ingest_one(file_path: str):
+            nonlocal completed
             doc_file = Path(file_path)
             try:
-                if self.progress_tracker and ProgressStage:
-                    self.progress_tracker.update(
-                        ProgressStage.PROCESSING_FILE,
-                        f"Indexing (LlamaIndex) {doc_file.name}",
-                        current=idx,
-                        total=total_files,
-                    )
+                async with semaphore:
+                    success = await pipeline.add_documents(self.kb_name, [file_path])
+            except Exception as e:
+                logger.exception(f"  ✗ Failed {doc_file.name}: {e}")
+                return None
+
+            completed += 1
+            if self.progress_tracker and ProgressStage:
+                self.progress_tracker.update(
+                    ProgressStage.PROCESSING_FILE,
+                    f"Indexing (LlamaIndex) {doc_file.name}",
+                    current=completed,
+                    total=total_files,
+                )
 
-                # Use add_documents for incremental add
-                success = await pipeline.add_documents(self.kb_name, [file_path])
-                if success:
-                    processed_files.append(doc_file)
-                    self._record_successful_hash(doc_file)
-                    logger.info(f"  ✓ Processed (LlamaIndex): {doc_file.name}")
-                else:
-                    logger.error(f"  ✗ Failed to index: {doc_file.name}")
+            if success:
+                self._record_successful_hash(doc_file)
+                logger.info(f"  ✓ Processed (LlamaIndex): {doc_file.name}")
+                return doc_file
+            logger.error(f"  ✗ Failed to index: {doc_file.name}")
+            return None
+
+        results = await asyncio.gather(*(_ingest_one(fp) for fp in file_paths))
+        return [doc_file for doc_file in results if doc_file is not None]
+
+    async def _ingest_text_files(
+        self, text_files, insert_func, total_files, completed_so_far, progress_stage
+    ) -> List[Path]:
+        """
+        Read and insert plain-text files, overlapping up to the ingest
+        concurrency bound so embedding/API latency is paid in parallel.
+
+        Args:
+            insert_func: Coroutine taking the file content (rag.ainsert or
+                         rag.lightrag.ainsert depending on the provider)
+            progress_stage: ProgressStage value for tracker updates, or None
+        """
+        from src.services.rag.components.routing import FileTypeRouter
+
+        semaphore = asyncio.Semaphore(self._ingest_concurrency)
+        completed = completed_so_far
+        processed: List[Path] = []
+
+        async def _one(doc_file_str: str):
+            nonlocal completed
+            doc_file = Path(doc_file_str)
+            try:
+                async with semaphore:
+                    if not doc_file.exists():
+                        logger.error(f"  ✗ Failed: File missing {doc_file.name}")
+                        return
+                    content = await FileTypeRouter.read_text_file(str(doc_file))
+                    if not content.strip():
+                        logger.warning(f"  ⚠ Skipped empty file: {doc_file.name}")
+                        return
+                    await insert_func(content)
             except Exception as e:
                 logger.exception(f"  ✗ Failed {doc_file.name}: {e}")
+                return
+
+            completed += 1
+            if self.progress_tracker and progress_stage:
+                self.progress_tracker.update(
+                    progress_stage,
+                    f"Ingesting (text) {doc_file.name}",
+                    current=completed,
+                    total=total_files,
+                )
+            processed.append(doc_file)
+            self._record_successful_hash(doc_file)
+            logger.info(f"  ✓ Processed (text): {doc_file.name}")
 
-        return processed_files
+        await asyncio.gather(*(_one(f) for f in text_files))
+        return processed
 
     async def _process_lightrag(self, new_files: List[Path]) -> List[Path]:
         """
@@ -298,15 +560,20 @@ class DocumentAdder:
         """
         logger.info("Using LightRAG incremental add (text-only)...")
 
-        # Lazy import lightrag
-        try:
-            from lightrag import LightRAG
-            from lightrag.utils import EmbeddingFunc
-        except ImportError as e:
-            raise ImportError(
-                f"LightRAG dependencies not installed. "
-                f"Install with: pip install lightrag. Error: {e}"
-            ) from e
+        # Lazy import lightrag (pre-warmed copy wins if available)
+        warmed = _PROVIDER_MODULES.get("lightrag")
+        if warmed:
+            LightRAG = warmed["LightRAG"]
+            EmbeddingFunc = warmed["EmbeddingFunc"]
+        else:
+            try:
+                from lightrag import LightRAG
+                from lightrag.utils import EmbeddingFunc
+            except ImportError as e:
+                raise ImportError(
+                    f"LightRAG dependencies not installed. "
+                    f"Install with: pip install lightrag. Error: {e}"
+                ) from e
 
         from src.services.embedding import (
             get_embedding_client,
@@ -395,33 +662,16 @@ class DocumentAdder:
             except Exception as e:
                 logger.exception(f"  ✗ Failed {doc_file.name}: {e}")
 
-        # Process text files directly
-        for doc_file_str in classification.text_files:
-            doc_file = Path(doc_file_str)
-            idx += 1
-            try:
-                if self.progress_tracker and ProgressStage:
-                    self.progress_tracker.update(
-                        ProgressStage.PROCESSING_FILE,
-                        f"Ingesting (text) {doc_file.name}",
-                        current=idx,
-                        total=total_files,
-                    )
-
-                if not doc_file.exists():
-                    logger.error(f"  ✗ Failed: File missing {doc_file.name}")
-                    continue
-
-                content = await FileTypeRouter.read_text_file(str(doc_file))
-                if content.strip():
-                    await rag.ainsert(content)
-                    processed_files.append(doc_file)
-                    self._record_successful_hash(doc_file)
-                    logger.info(f"  ✓ Processed (text): {doc_file.name}")
-                else:
-                    logger.warning(f"  ⚠ Skipped empty file: {doc_file.name}")
-            except Exception as e:
-                logger.exception(f"  ✗ Failed {doc_file.name}: {e}")
+        # Process text files directly, overlapping inserts
+        processed_files.extend(
+            await self._ingest_text_files(
+                classification.text_files,
+                rag.ainsert,
+                total_files,
+                idx,
+                ProgressStage.PROCESSING_FILE if ProgressStage else None,
+            )
+        )
 
         for doc_file_str in classification.unsupported:
             logger.warning(f"  ⚠ Skipped unsupported file: {Path(doc_file_str).name}")
@@ -441,21 +691,24 @@ class DocumentAdder:
         parser_name = "MinerU" if parser == "mineru" else "Docling"
         logger.info(f"Using RAGAnything incremental add with {parser_name} parser...")
 
-        # Lazy import raganything
-        try:
-            # Add RAG-Anything to path if needed
-            project_root = Path(__file__).resolve().parent.parent.parent
-            raganything_path = project_root.parent / "raganything" / "RAG-Anything"
-            if raganything_path.exists() and str(raganything_path) not in sys.path:
-                sys.path.insert(0, str(raganything_path))
-
-            from lightrag.utils import EmbeddingFunc
-            from raganything import RAGAnything, RAGAnythingConfig
-        except ImportError as e:
-            raise ImportError(
-                f"RAGAnything dependencies not installed. "
-                f"Please install raganything package. Error: {e}"
-            ) from e
+        # Lazy import raganything (pre-warmed copy wins if available)
+        warmed = _PROVIDER_MODULES.get("raganything") or _PROVIDER_MODULES.get(
+            "raganything_docling"
+        )
+        if warmed:
+            RAGAnything = warmed["RAGAnything"]
+            RAGAnythingConfig = warmed["RAGAnythingConfig"]
+            EmbeddingFunc = warmed["EmbeddingFunc"]
+        else:
+            try:
+                _ensure_raganything_path()
+                from lightrag.utils import EmbeddingFunc
+                from raganything import RAGAnything, RAGAnythingConfig
+            except ImportError as e:
+                raise ImportError(
+                    f"RAGAnything dependencies not installed. "
+                    f"Please install raganything package. Error: {e}"
+                ) from e
 
         from src.services.embedding import (
             get_embedding_client,
@@ -581,33 +834,16 @@ class DocumentAdder:
             except Exception as e:
                 logger.exception(f"  ✗ Failed {doc_file.name}: {e}")
 
-        # Process text files directly
-        for doc_file_str in classification.text_files:
-            doc_file = Path(doc_file_str)
-            idx += 1
-            try:
-                if self.progress_tracker and ProgressStage:
-                    self.progress_tracker.update(
-                        ProgressStage.PROCESSING_FILE,
-                        f"Ingesting (text) {doc_file.name}",
-                        current=idx,
-                        total=total_files,
-                    )
-
-                if not doc_file.exists():
-                    logger.error(f"  ✗ Failed: File missing {doc_file.name}")
-                    continue
-
-                content = await FileTypeRouter.read_text_file(str(doc_file))
-                if content.strip():
-                    await rag.lightrag.ainsert(content)
-                    processed_files.append(doc_file)
-                    self._record_successful_hash(doc_file)
-                    logger.info(f"  ✓ Processed (text): {doc_file.name}")
-                else:
-                    logger.warning(f"  ⚠ Skipped empty file: {doc_file.name}")
-            except Exception as e:
-                logger.exception(f"  ✗ Failed {doc_file.name}: {e}")
+        # Process text files directly, overlapping inserts
+        processed_files.extend(
+            await self._ingest_text_files(
+                classification.text_files,
+                rag.lightrag.ainsert,
+                total_files,
+                idx,
+                ProgressStage.PROCESSING_FILE if ProgressStage else None,
+            )
+        )
 
         for doc_file_str in classification.unsupported:
             logger.warning(f"  ⚠ Skipped unsupported file: {Path(doc_file_str).name}")
@@ -653,31 +889,141 @@ class DocumentAdder:
                     logger.error(f"Failed to read file as text: {e}")
                     return ""
 
-    def _record_successful_hash(self, file_path: Path):
-        """Update metadata with the hash of a successfully processed file."""
-        file_hash = self._get_file_hash(file_path)
+    def _record_successful_hash(self, file_path: Path, file_hash: str | None = None):
+        """Update metadata with the hash of a successfully processed file.
+
+        The hash computed while staging is reused via ``_hash_cache``;
+        re-reading the file here would double the I/O per document.
+        """
+        if file_hash is None:
+            file_hash = self._hash_cache.get(str(file_path))
+        if file_hash is None:
+            file_hash = self._get_file_hash(file_path)
+            self._hash_cache[str(file_path)] = file_hash
         try:
+            # Inside a batch: record to the cheap append-only WAL and buffer;
+            # metadata.json is rewritten (and fsynced) once at flush_batch()
+            if self._pending_hashes is not None:
+                self._append_pending_row(file_path.name, file_hash)
+                self._pending_hashes[file_path.name] = file_hash
+                return
+
             metadata = {}
             if self.metadata_file.exists():
-                with open(self.metadata_file, "r", encoding="utf-8") as f:
-                    metadata = json.load(f)
+                metadata = _read_json(self.metadata_file)
 
             if "file_hashes" not in metadata:
                 metadata["file_hashes"] = {}
 
             metadata["file_hashes"][file_path.name] = file_hash
-            # Atomic write: write to temp file, then rename
-            fd, tmp_path = tempfile.mkstemp(dir=self.kb_dir, suffix=".json")
-            try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    json.dump(metadata, f, indent=2, ensure_ascii=False)
-                os.replace(tmp_path, self.metadata_file)
-            except Exception:
-                os.unlink(tmp_path)
-                raise
+            # Hot path: compact dump, no pretty-printing
+            self._write_metadata_atomic(metadata, indent=None)
         except Exception as e:
             logger.warning(f"Could not update hash metadata: {e}")
 
+    def _append_pending_row(self, file_name: str, file_hash: str):
+        """Append one hash record to the pending WAL (crash-recovery log)."""
+        row = {"file": file_name, "hash": file_hash}
+        if orjson is not None:
+            data = orjson.dumps(row) + b"\n"
+        else:
+            data = (json.dumps(row, separators=(",", ":")) + "\n").encode("utf-8")
+        with open(self.kb_dir / "pending.log", "ab") as f:
+            f.write(data)
+
+    def begin_batch(self):
+        """
+        Start buffering per-file hash updates for this ingest batch.
+
+        While a batch is open, _record_successful_hash writes only a cheap
+        append to pending.log; metadata.json is rewritten and fsynced once
+        in flush_batch(). Any pending.log left by a crashed run is replayed
+        first so its hashes are not lost.
+        """
+        self._replay_pending_log()
+        self._pending_hashes = {}
+
+    def flush_batch(self):
+        """Fold buffered hash updates into metadata.json with a single fsync."""
+        pending = self._pending_hashes
+        self._pending_hashes = None
+        if pending:
+            try:
+                metadata = {}
+                if self.metadata_file.exists():
+                    metadata = _read_json(self.metadata_file)
+                metadata.setdefault("file_hashes", {}).update(pending)
+                self._write_metadata_atomic(metadata, indent=None)
+            except Exception as e:
+                # Keep pending.log so the next run can replay these hashes
+                logger.warning(f"Could not flush hash metadata batch: {e}")
+                return
+        pending_log = self.kb_dir / "pending.log"
+        if pending_log.exists():
+            pending_log.unlink()
+
+    def _replay_pending_log(self):
+        """Fold hashes from a leftover pending.log into metadata.json."""
+        pending_log = self.kb_dir / "pending.log"
+        if not pending_log.exists():
+            return
+        try:
+            recovered: Dict[str, str] = {}
+            with open(pending_log, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        row = json.loads(line)
+                        recovered[row["file"]] = row["hash"]
+                    except (json.JSONDecodeError, KeyError):
+                        continue
+
+            if recovered:
+                logger.info(f"Recovering {len(recovered)} hash records from pending.log")
+                metadata = {}
+                if self.metadata_file.exists():
+                    metadata = _read_json(self.metadata_file)
+                metadata.setdefault("file_hashes", {}).update(recovered)
+                self._write_metadata_atomic(metadata, indent=None)
+
+            pending_log.unlink()
+        except Exception as e:
+            logger.warning(f"Could not replay pending.log: {e}")
+
+    def _write_metadata_atomic(self, metadata: Dict[str, Any], indent: int | None = None):
+        """
+        Write metadata.json via tempfile + fsync + os.replace.
+
+        Readers never observe a partial file: the rename is the commit
+        point, and the fsync ensures the temp file's bytes are durable
+        before it replaces the old metadata.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.kb_dir, suffix=".json")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if orjson is not None:
+                    f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2 if indent else 0))
+                else:
+                    # No indent on the hot path; compact separators shave the
+                    # ", "/": " padding stdlib json emits by default. Default
+                    # ensure_ascii keeps the encode step in the one-byte fast
+                    # path; non-ASCII filenames round-trip via \uXXXX escapes.
+                    f.write(
+                        json.dumps(
+                            metadata,
+                            indent=indent,
+                            separators=None if indent else (",", ":"),
+                        ).encode("ascii")
+                    )
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.metadata_file)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
     @staticmethod
     def _filter_valid_messages(messages):
         return [
@@ -698,36 +1044,30 @@ class DocumentAdder:
         """
         logger.info("Checking for leftover parser output directories...")
 
-        # Support both 'auto' (MinerU) and 'docling' parser output directories
-        parser_subdirs = ["auto", "docling"]
-        cleaned_count = 0
-
-        for doc_dir in list(self.content_list_dir.glob("*")):
-            if not doc_dir.is_dir():
-                continue
-
-            for parser_subdir in parser_subdirs:
-                subdir = doc_dir / parser_subdir
-                if subdir.exists():
-                    try:
-                        # Check if directory is empty or only contains empty subdirs
-                        has_content = any(
-                            f.is_file() or (f.is_dir() and any(f.iterdir()))
-                            for f in subdir.iterdir()
-                        )
-
-                        if not has_content:
-                            await self._run_in_executor(shutil.rmtree, subdir)
-                            cleaned_count += 1
-                    except Exception as e:
-                        logger.debug(f"Could not clean up {subdir}: {e}")
-
-            # Remove doc_dir if it's now empty
-            try:
-                if doc_dir.exists() and not any(doc_dir.iterdir()):
-                    doc_dir.rmdir()
-            except Exception:
-                pass
+        def _remove_empty_dirs(root: str) -> int:
+            """Prune empty directories below root, bottom-up."""
+            removed = 0
+            for dirpath, _dirnames, filenames in os.walk(root, topdown=False):
+                if dirpath == root or filenames:
+                    continue
+                try:
+                    # Re-check emptiness: os.walk listed children before any
+                    # of them were pruned by earlier iterations
+                    with os.scandir(dirpath) as entries:
+                        if next(entries, None) is not None:
+                            continue
+                    os.rmdir(dirpath)
+                    removed += 1
+                except OSError as e:
+                    logger.debug(f"Could not clean up {dirpath}: {e}")
+            return removed
+
+        # Bottom-up walk removes 'auto'/'docling' parser dirs and the
+        # per-document dirs they leave behind in a single executor hop,
+        # without hardcoding parser names
+        cleaned_count = await self._run_in_executor(
+            _remove_empty_dirs, str(self.content_list_dir)
+        )
 
         if cleaned_count > 0:
             logger.info(f"Cleaned up {cleaned_count} empty parser directories")
@@ -755,42 +1095,163 @@ class DocumentAdder:
                     merge=output_file.exists(),
                 )
 
+    def schedule_numbered_extraction(self, processed_files, batch_size=20):
+        """
+        Queue numbered-item extraction to run in the background.
+
+        The caller gets control back as soon as RAG insertion finishes;
+        extraction catches up on the shared single worker. Returns the
+        Future (or None when there is nothing to do) so callers that need
+        completion, e.g. the CLI before exit, can wait on it.
+        """
+        if not processed_files:
+            return None
+
+        future = _extraction_executor.submit(
+            self.extract_numbered_items_for_new_docs, processed_files, batch_size
+        )
+        future.add_done_callback(self._log_extraction_outcome)
+        return future
+
+    @staticmethod
+    def _log_extraction_outcome(future):
+        exc = future.exception()
+        if exc is not None:
+            logger.error(f"Background numbered-item extraction failed: {exc}")
+
+    def _append_history_row(self, row: Dict[str, Any]):
+        """Append one update-history row to update_history.jsonl.
+
+        A single append is O(row) instead of re-serializing the whole
+        metadata blob (file_hashes, full history) per update.
+        """
+        if orjson is not None:
+            data = orjson.dumps(row) + b"\n"
+        else:
+            # Default ensure_ascii: rows are timestamps/counts/provider
+            # names, and anything else round-trips via \uXXXX escapes
+            data = (json.dumps(row, separators=(",", ":")) + "\n").encode("ascii")
+        with open(self.history_file, "ab") as f:
+            f.write(data)
+
+    def history(self):
+        """Yield update-history rows (oldest first) from update_history.jsonl."""
+        if not self.history_file.exists():
+            return
+        with open(self.history_file, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
     def update_metadata(self, added_count: int):
-        """Update metadata after incremental add.
+        """Record an incremental add: append history, refresh last_updated.
+
+        History goes to update_history.jsonl (append-only, O(1) regardless
+        of KB age); metadata.json stays lean and is only touched to bump
+        last_updated.
 
         Note: We do NOT update rag_provider here - incremental adds must use
         the same provider as the original initialization for consistency.
         """
+        if added_count <= 0:
+            # Nothing was ingested; don't write a no-op history row
+            return
         if not self.metadata_file.exists():
             return
         try:
-            with open(self.metadata_file, "r", encoding="utf-8") as f:
-                metadata = json.load(f)
-
-            metadata["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-            # Record the provider used (should match what's already in metadata)
+            row = {
+                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "action": "incremental_add",
+                "count": added_count,
+                "provider": self._resolved_provider,
+            }
+            self._append_history_row(row)
+
+            metadata = _read_json(self.metadata_file)
+            metadata["last_updated"] = row["timestamp"]
             if "rag_provider" not in metadata and self._resolved_provider:
                 metadata["rag_provider"] = self._resolved_provider
+            self._write_metadata_atomic(metadata, indent=None)
+        except Exception as e:
+            logger.warning(f"Metadata update failed: {e}")
 
-            history = metadata.get("update_history", [])
-            history.append(
-                {
-                    "timestamp": metadata["last_updated"],
-                    "action": "incremental_add",
-                    "count": added_count,
-                    "provider": self._resolved_provider,
-                }
-            )
-            metadata["update_history"] = history
+    def compact_metadata(self):
+        """Migrate legacy history storage into update_history.jsonl.
 
-            with open(self.metadata_file, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+        Older KBs carry their history embedded in metadata.json (and
+        possibly a metadata.log side file from interrupted runs). Move
+        those rows to the front of update_history.jsonl and strip the
+        blob from metadata.json so subsequent updates stay O(1). No-op
+        once a KB is migrated. Malformed lines (torn writes from a
+        crashed run) are skipped.
+        """
+        if not self.metadata_file.exists():
+            return
+        try:
+            metadata = _read_json(self.metadata_file)
+            legacy_rows = metadata.pop("update_history", None) or []
+
+            old_log = self.metadata_file.with_suffix(".log")
+            if old_log.exists():
+                with open(old_log, encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            legacy_rows.append(json.loads(line))
+                        except json.JSONDecodeError:
+                            continue
+
+            if not legacy_rows:
+                return
+
+            # Legacy rows predate anything already in the JSONL: prepend
+            existing = b""
+            if self.history_file.exists():
+                with open(self.history_file, "rb") as f:
+                    existing = f.read()
+            if orjson is not None:
+                lines = b"".join(orjson.dumps(row) + b"\n" for row in legacy_rows)
+            else:
+                lines = "".join(
+                    json.dumps(row, separators=(",", ":"), ensure_ascii=False) + "\n"
+                    for row in legacy_rows
+                ).encode("utf-8")
+            # Atomic replace: a crash mid-write must not lose the rows
+            # already appended to the history file
+            fd, tmp_path = tempfile.mkstemp(dir=self.kb_dir, suffix=".jsonl")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(lines + existing)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.history_file)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+
+            # Migration is rare and human-facing: keep it pretty-printed
+            self._write_metadata_atomic(metadata, indent=2)
+            if old_log.exists():
+                old_log.unlink()
+            logger.info(f"Migrated {len(legacy_rows)} history rows to update_history.jsonl")
         except Exception as e:
-            logger.warning(f"Metadata update failed: {e}")
+            logger.warning(f"Metadata history migration failed: {e}")
 
 
 async def main():
+    # CLI-only dependencies: imported here so programmatic users of
+    # DocumentAdder don't pay for them at module import
+    import argparse
+
+    from dotenv import load_dotenv
+
     parser = argparse.ArgumentParser(
         description="Incrementally add documents to RAG KB",
         epilog="""
@@ -809,6 +1270,12 @@ Example usage:
     parser.add_argument("--api-key", default=os.getenv("LLM_API_KEY"))
     parser.add_argument("--base-url", default=os.getenv("LLM_HOST"))
     parser.add_argument("--allow-duplicates", action="store_true")
+    parser.add_argument(
+        "--ingest-concurrency",
+        type=int,
+        default=None,
+        help="Max files ingested in parallel (default: INGEST_CONCURRENCY env or 8)",
+    )
 
     args = parser.parse_args()
 
@@ -818,15 +1285,32 @@ Example usage:
     if args.docs:
         doc_files.extend(args.docs)
     if args.docs_dir:
-        p = Path(args.docs_dir)
-        for ext in ["*.pdf", "*.docx", "*.txt", "*.md"]:
-            doc_files.extend([str(f) for f in p.glob(ext)])
+        # Single directory pass instead of one glob walk per extension;
+        # also matches extensions case-insensitively
+        doc_exts = {".pdf", ".docx", ".txt", ".md"}
+        try:
+            with os.scandir(args.docs_dir) as entries:
+                doc_files.extend(
+                    entry.path
+                    for entry in entries
+                    if entry.is_file() and os.path.splitext(entry.name)[1].lower() in doc_exts
+                )
+        except OSError as e:
+            # Missing/unreadable directory degrades to "no documents",
+            # matching the old glob behavior
+            logger.warning(f"Could not read --docs-dir {args.docs_dir}: {e}")
 
     if not doc_files:
         logger.error("No documents provided.")
         return
 
-    adder = DocumentAdder(args.kb_name, args.base_dir, args.api_key, args.base_url)
+    adder = DocumentAdder(
+        args.kb_name,
+        args.base_dir,
+        args.api_key,
+        args.base_url,
+        ingest_concurrency=args.ingest_concurrency,
+    )
 
     # 1. Sync Phase (Validate and Stage)
     new_files = adder.add_documents(doc_files, allow_duplicates=args.allow_duplicates)
@@ -835,8 +1319,12 @@ Example usage:
     if new_files:
         processed = await adder.process_new_documents(new_files)
         if processed:
-            adder.extract_numbered_items_for_new_docs(processed)
+            extraction = adder.schedule_numbered_extraction(processed)
             adder.update_metadata(len(processed))
+            adder.compact_metadata()
+            if extraction is not None:
+                logger.info("Waiting for numbered-item extraction to finish...")
+                await asyncio.wrap_future(extraction)
             logger.info(f"Done! Successfully added {len(processed)} documents.")
     else:
         logger.info("No new unique documents to add.")
@@ -7,6 +7,7 @@ Manages multiple knowledge bases and provides utilities for accessing them.
 """
 
 from contextlib import contextmanager
+import copy
 from datetime import datetime
 import hashlib
 import json
@@ -72,11 +73,32 @@ class KnowledgeBaseManager:
 
         # Config file to track knowledge bases
         self.config_file = self.base_dir / "kb_config.json"
+
+        # mtime-keyed caches: list/info are called per request from UI
+        # handlers, while kb_config.json and metadata.json only change on
+        # ingest or status updates
+        self._config_cache: tuple[int, dict] | None = None
+        self._metadata_cache: dict[str, tuple[int, dict]] = {}
+
         self.config = self._load_config()
 
     def _load_config(self) -> dict:
-        """Load knowledge base configuration (kb_config.json only stores KB list)"""
+        """Load knowledge base configuration (kb_config.json only stores KB list)
+
+        Cached on the file's mtime: repeated list/info calls pay one stat()
+        instead of a locked read + JSON parse. Writers go through
+        _save_config, which bumps the mtime and invalidates the cache.
+        """
         if self.config_file.exists():
+            try:
+                mtime_ns = self.config_file.stat().st_mtime_ns
+                if self._config_cache is not None and self._config_cache[0] == mtime_ns:
+                    # Deep copy: callers assign this to self.config and
+                    # mutate nested per-KB dicts; the cache must keep
+                    # mirroring what is on disk, not unsaved state
+                    return copy.deepcopy(self._config_cache[1])
+            except OSError:
+                mtime_ns = None
             try:
                 with open(self.config_file, encoding="utf-8") as f:
                     with file_lock_shared(f):
@@ -96,6 +118,8 @@ class KnowledgeBaseManager:
                     # Note: Don't save during load to avoid recursion issues
                     # The next _save_config() call will persist this change
 
+                if mtime_ns is not None:
+                    self._config_cache = (mtime_ns, copy.deepcopy(config))
                 return config
             except (json.JSONDecodeError, Exception) as e:
                 print(f"[KnowledgeBaseManager] Error loading config: {e}")
@@ -299,6 +323,23 @@ class KnowledgeBaseManager:
 
         return {}
 
+    def _read_kb_metadata(self, kb_name: str, metadata_file: Path) -> dict:
+        """Read a KB's metadata.json, cached on the file's mtime.
+
+        Returns a deep copy: a shallow one would still alias nested values
+        (file_hashes etc.), letting callers corrupt cached state one level
+        down.
+        """
+        mtime_ns = metadata_file.stat().st_mtime_ns
+        cached = self._metadata_cache.get(kb_name)
+        if cached is not None and cached[0] == mtime_ns:
+            return copy.deepcopy(cached[1])
+
+        with open(metadata_file, encoding="utf-8") as f:
+            metadata = json.load(f)
+        self._metadata_cache[kb_name] = (mtime_ns, metadata)
+        return copy.deepcopy(metadata)
+
     def get_info(self, name: str | None = None) -> dict:
         """Get detailed information about a knowledge base.
 
@@ -345,13 +386,12 @@ class KnowledgeBaseManager:
             "progress": progress,
         }
 
-        # Read metadata.json (if exists)
+        # Read metadata.json (if exists), cached on its mtime
         if dir_exists:
             metadata_file = kb_dir / "metadata.json"
             if metadata_file.exists():
                 try:
-                    with open(metadata_file, encoding="utf-8") as f:
-                        info["metadata"] = json.load(f)
+                    info["metadata"] = self._read_kb_metadata(kb_name, metadata_file)
                 except Exception as e:
                     print(f"Warning: Failed to read metadata.json for KB '{kb_name}': {e}")
                     info["metadata"] = {}
@@ -4,7 +4,7 @@
 import logging
 from typing import Any, Dict
 
-import httpx
+from src.services.http import get_async_http_client
 
 from .base import BaseEmbeddingAdapter, EmbeddingRequest, EmbeddingResponse
 
@@ -45,19 +45,18 @@ class OpenAICompatibleEmbeddingAdapter(BaseEmbeddingAdapter):
 
         logger.debug(f"Sending embedding request to {url} with {len(request.texts)} texts")
 
-        # Create httpx client with explicit decompression support
-        # httpx will auto-decompress gzip, deflate, brotli (if brotli is installed)
-        async with httpx.AsyncClient(
-            timeout=self.request_timeout,
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
-        ) as client:
-            response = await client.post(url, json=payload, headers=headers)
+        # Shared pooled client (auto-decompresses gzip, deflate, brotli if
+        # brotli is installed); do not close it here
+        client = get_async_http_client()
+        response = await client.post(
+            url, json=payload, headers=headers, timeout=self.request_timeout
+        )
 
-            if response.status_code >= 400:
-                logger.error(f"HTTP {response.status_code} response body: {response.text}")
+        if response.status_code >= 400:
+            logger.error(f"HTTP {response.status_code} response body: {response.text}")
 
-            response.raise_for_status()
-            data = response.json()
+        response.raise_for_status()
+        data = response.json()
 
         embeddings = [item["embedding"] for item in data["data"]]
 
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+"""Shared HTTP client helpers."""
+
+from .client import close_async_http_client, get_async_http_client
+
+__all__ = ["get_async_http_client", "close_async_http_client"]
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Shared Async HTTP Client
+========================
+
+Pooled httpx.AsyncClient shared by embedding adapters and test
+harnesses. Reusing one client per event loop amortizes TLS handshakes
+and keepalive pools across all API calls on that loop.
+
+One client per *running loop*, not per process: this tree runs many
+short-lived loops (sync wrappers call asyncio.run per request, and
+background workers spin up their own), and a keepalive connection
+pooled under a closed loop raises "Event loop is closed" when a later
+loop picks it up.
+"""
+
+import asyncio
+import atexit
+import os
+from typing import Dict, Optional
+
+import httpx
+
+from src.logging import get_logger
+
+logger = get_logger("HTTPClient")
+
+# Running loop (or None when constructed outside one) -> client
+_clients: Dict[Optional[asyncio.AbstractEventLoop], httpx.AsyncClient] = {}
+
+
+def _make_client() -> httpx.AsyncClient:
+    client_kwargs = {
+        "limits": httpx.Limits(max_connections=200, max_keepalive_connections=50),
+        "timeout": httpx.Timeout(60.0, connect=10.0),
+    }
+
+    # SSL handling for dev/troubleshooting
+    if os.getenv("DISABLE_SSL_VERIFY", "").lower() in ("true", "1", "yes"):
+        client_kwargs["verify"] = False
+
+    try:
+        return httpx.AsyncClient(http2=True, **client_kwargs)
+    except ImportError:
+        # h2 not installed; plain HTTP/1.1 pooling still applies
+        return httpx.AsyncClient(**client_kwargs)
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Get the pooled httpx.AsyncClient for the current event loop.
+
+    The client enables connection pooling (and HTTP/2 multiplexing when
+    the optional h2 package is installed) and honors DISABLE_SSL_VERIFY.
+    Callers must NOT close it; clients are torn down at interpreter exit.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        # Drop clients stranded on loops that have since closed; their
+        # connections died with the loop
+        for stale_loop in [k for k in _clients if k is not None and k.is_closed()]:
+            del _clients[stale_loop]
+
+        client = _make_client()
+        _clients[loop] = client
+
+    return client
+
+
+def close_async_http_client():
+    """Close any shared clients that were created."""
+    global _clients
+    for client in _clients.values():
+        if client.is_closed:
+            continue
+        try:
+            asyncio.run(client.aclose())
+        except RuntimeError:
+            # Called from a running loop, or the client's connections
+            # belonged to an already-closed loop; they die with the process
+            logger.debug("Could not close shared HTTP client cleanly")
+    _clients = {}
+
+
+atexit.register(close_async_http_client)
@@ -9,8 +9,8 @@ import logging
 import random
 from typing import Any, Callable, Dict
 
-from ...utils.error_rate_tracker import record_provider_call
-from ...utils.network.circuit_breaker import is_call_allowed, record_call_success
+from src.utils.error_rate_tracker import record_provider_call
+from src.utils.network.circuit_breaker import is_call_allowed, record_call_success
 from ..error_mapping import map_error
 from ..exceptions import (
     LLMAPIError,
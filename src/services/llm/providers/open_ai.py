@@ -17,7 +17,10 @@ class OpenAIProvider(BaseLLMProvider):
     def __init__(self, config):
         super().__init__(config)
 
-        # Create httpx client for better control
+        # Per-instance httpx client: the AsyncOpenAI below is cached for the
+        # provider's lifetime, so it cannot share the per-event-loop pool
+        # from src.services.http (a client captured at construction would be
+        # reused across loops and break on closed-loop keepalives).
         # Note: brotli must be installed for decompression of brotli-compressed responses
         http_client_kwargs = {
             "limits": httpx.Limits(max_connections=100, max_keepalive_connections=20),
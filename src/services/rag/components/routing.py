@@ -138,6 +138,14 @@ class FileTypeRouter:
     # Image extensions (may need OCR)
     IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp", ".tiff", ".tif"}
 
+    # Cache for content-sniff results: path -> (mtime_ns, is_text).
+    # Extension-based classification is already stat-free; only unknown
+    # extensions fall back to reading file headers, and callers (ingestion
+    # pipelines) may classify the same staged files several times per run.
+    # Keying by path means a rewritten file replaces its own entry instead
+    # of leaving stale (path, old_mtime) keys behind for the process life.
+    _sniff_cache: dict = {}
+
     @classmethod
     def get_document_type(cls, file_path: str) -> DocumentType:
         """
@@ -160,8 +168,22 @@ class FileTypeRouter:
         elif ext in cls.IMAGE_EXTENSIONS:
             return DocumentType.IMAGE
         else:
-            # Try to detect if it's a text file by content
-            if cls._is_text_file(file_path):
+            # Try to detect if it's a text file by content (cached per mtime
+            # so repeated classification of the same file avoids re-reading it)
+            try:
+                mtime_ns = Path(file_path).stat().st_mtime_ns
+            except OSError:
+                mtime_ns = None
+
+            cached = cls._sniff_cache.get(file_path) if mtime_ns is not None else None
+            if cached is not None and cached[0] == mtime_ns:
+                is_text = cached[1]
+            else:
+                is_text = cls._is_text_file(file_path)
+                if mtime_ns is not None:
+                    cls._sniff_cache[file_path] = (mtime_ns, is_text)
+
+            if is_text:
                 return DocumentType.TEXT
             return DocumentType.UNKNOWN
 
@@ -6,12 +6,19 @@ RAG Service
 Unified RAG service providing a single entry point for all RAG operations.
 """
 
+from dataclasses import dataclass
+import functools
 import json
 import os
 from pathlib import Path
 import shutil
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
 from src.logging import get_logger
 
 from .factory import get_pipeline, has_pipeline, list_pipelines
@@ -22,6 +29,53 @@ DEFAULT_KB_BASE_DIR = str(
 )
 
 
+@functools.lru_cache(maxsize=256)
+def _dir_nonempty(path_str: str, mtime_ns: int) -> bool:
+    """
+    Check whether a directory has at least one entry.
+
+    Short-circuits on the first entry instead of materializing the whole
+    listing. The mtime_ns key makes the lru_cache self-invalidating: a
+    directory's mtime changes whenever entries are added or removed, so
+    stale answers age out naturally.
+    """
+    try:
+        with os.scandir(path_str) as entries:
+            return next(entries, None) is not None
+    except OSError:
+        return False
+
+
+@dataclass
+class KBStatus:
+    """
+    Snapshot of a knowledge base's on-disk state, probed in one pass.
+
+    Attributes:
+        exists: KB directory exists
+        has_rag: rag_storage exists and has content
+        has_llamaindex: llamaindex_storage exists and has content
+        has_raw: raw/ exists and has content
+        provider: Provider resolved from metadata or storage layout,
+                  None when neither gives an answer
+    """
+
+    exists: bool
+    has_rag: bool = False
+    has_llamaindex: bool = False
+    has_raw: bool = False
+    provider: Optional[str] = None
+
+
+def _has_content(directory: Path) -> bool:
+    """True if directory exists and contains at least one entry."""
+    try:
+        mtime_ns = directory.stat().st_mtime_ns
+    except OSError:
+        return False
+    return _dir_nonempty(str(directory), mtime_ns)
+
+
 class RAGService:
     """
     Unified RAG service entry point.
@@ -58,8 +112,14 @@ class RAGService:
         """
         self.logger = get_logger("RAGService")
         self.kb_base_dir = kb_base_dir or DEFAULT_KB_BASE_DIR
+        # Parsed once; per-request code joins kb_name onto this instead of
+        # re-parsing the base directory string every call
+        self._kb_base_path = Path(self.kb_base_dir)
         self.provider = provider or os.getenv("RAG_PROVIDER", "raganything")
         self._pipeline = None
+        # kb_name -> (mtime_ns, parsed metadata.json); metadata only changes
+        # during ingest, so steady-state searches skip the re-parse
+        self._metadata_cache: Dict[str, tuple] = {}
 
     def _get_pipeline(self):
         """Get or create pipeline instance."""
@@ -112,30 +172,20 @@ class RAGService:
             result = await service.search("What is ML?", "textbook")
             print(result["answer"])
         """
-        # Validate KB exists and has indexed data
-        kb_dir = Path(self.kb_base_dir) / kb_name
-        if not kb_dir.exists():
+        # Validate KB exists and has indexed data with a single probe
+        kb_dir = self._kb_base_path / kb_name
+        status = self._probe_kb_status(kb_name, kb_dir)
+        if not status.exists:
             raise ValueError(
                 f"Knowledge base '{kb_name}' not found. "
                 f"Please create it first using the Knowledge page."
             )
 
-        # Check if RAG storage is initialized
-        rag_storage_dir = kb_dir / "rag_storage"
-        llamaindex_storage_dir = kb_dir / "llamaindex_storage"
-        
-        # Check if storage directories exist and have content
-        rag_has_content = rag_storage_dir.exists() and any(rag_storage_dir.iterdir())
-        llamaindex_has_content = llamaindex_storage_dir.exists() and any(llamaindex_storage_dir.iterdir())
-        
-        if not (rag_has_content or llamaindex_has_content):
-            raw_dir = kb_dir / "raw"
-            has_docs = raw_dir.exists() and any(raw_dir.iterdir())
-            
+        if not (status.has_rag or status.has_llamaindex):
             error_msg = (
                 f"Knowledge base '{kb_name}' exists but has not been indexed yet. "
             )
-            if has_docs:
+            if status.has_raw:
                 error_msg += (
                     f"Documents are present in the 'raw' folder, but RAG indexing did not complete. "
                     f"Please refresh the knowledge base using the 'Refresh' button on the Knowledge page "
@@ -145,11 +195,11 @@ class RAGService:
                 error_msg += (
                     f"No documents found. Please upload documents to this knowledge base first."
                 )
-            
+
             raise ValueError(error_msg)
 
-        # Get the provider from KB metadata, fallback to instance provider
-        provider = self._get_provider_for_kb(kb_name)
+        # Provider already resolved by the probe, fallback to instance provider
+        provider = status.provider or self.provider
 
         self.logger.info(
             f"Searching KB '{kb_name}' with provider '{provider}' and query: {query[:50]}..."
@@ -174,52 +224,114 @@ class RAGService:
 
         return result
 
-    def _get_provider_for_kb(self, kb_name: str) -> str:
+    def _load_kb_metadata(self, kb_name: str) -> Optional[Dict[str, Any]]:
         """
-        Get the RAG provider for a specific knowledge base from its metadata.
-        Falls back to instance provider or env var if not found in metadata.
+        Load a KB's metadata.json, cached on the file's mtime.
 
-        Args:
-            kb_name: Knowledge base name
+        Repeated searches against the same KB pay one stat() instead of an
+        open/read/parse cycle; the cache refreshes whenever ingest rewrites
+        the file.
 
         Returns:
-            Provider name (e.g., 'llamaindex', 'lightrag', 'raganything')
+            Parsed metadata dict, or None if the file is missing
+        """
+        metadata_file = self._kb_base_path / kb_name / "metadata.json"
+        try:
+            mtime_ns = metadata_file.stat().st_mtime_ns
+        except OSError:
+            self._metadata_cache.pop(kb_name, None)
+            return None
+
+        cached = self._metadata_cache.get(kb_name)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        if orjson is not None:
+            with open(metadata_file, "rb") as f:
+                metadata = orjson.loads(f.read())
+        else:
+            with open(metadata_file, encoding="utf-8") as f:
+                metadata = json.load(f)
+        self._metadata_cache[kb_name] = (mtime_ns, metadata)
+        return metadata
+
+    def _probe_kb_status(self, kb_name: str, kb_dir: Optional[Path] = None) -> KBStatus:
+        """
+        Probe a KB's on-disk state in one pass.
+
+        One scandir of the KB directory answers existence and which
+        children are present; content checks then go through the cached
+        _has_content probe, and the provider is resolved from (cached)
+        metadata with the storage-layout fallback. Callers get everything
+        search needs without re-stating the same directories.
         """
+        if kb_dir is None:
+            kb_dir = self._kb_base_path / kb_name
+
         try:
-            metadata_file = Path(self.kb_base_dir) / kb_name / "metadata.json"
+            with os.scandir(kb_dir) as entries:
+                children = {entry.name for entry in entries}
+        except OSError:
+            return KBStatus(exists=False)
+
+        has_rag = "rag_storage" in children and _has_content(kb_dir / "rag_storage")
+        has_llamaindex = "llamaindex_storage" in children and _has_content(
+            kb_dir / "llamaindex_storage"
+        )
+        has_raw = "raw" in children and _has_content(kb_dir / "raw")
 
-            if metadata_file.exists():
-                with open(metadata_file, encoding="utf-8") as f:
-                    metadata = json.load(f)
+        provider = None
+        if "metadata.json" in children:
+            try:
+                metadata = self._load_kb_metadata(kb_name)
+                if metadata is not None:
                     provider = metadata.get("rag_provider")
                     if provider:
                         self.logger.info(f"Using provider '{provider}' from KB metadata")
-                        return provider
+            except Exception as e:
+                self.logger.warning(f"Error reading provider from metadata: {e}")
 
+        if not provider:
             # Fallback based on directory structure (robustness check)
             # This aligns with DocumentAdder logic to support KBs created without metadata
-            kb_dir = Path(self.kb_base_dir) / kb_name
-            llamaindex_storage = kb_dir / "llamaindex_storage"
-            rag_storage = kb_dir / "rag_storage"
-            
-            # Check which storage actually has data (not just exists)
-            if llamaindex_storage.exists() and any(llamaindex_storage.iterdir()):
-                self.logger.info(f"Detected LlamaIndex storage with data for '{kb_name}', using provider: llamaindex")
-                return "llamaindex"
-            
-            if rag_storage.exists() and any(rag_storage.iterdir()):
-                self.logger.info(f"Detected RAG storage with data for '{kb_name}', using default provider: {self.provider}")
-                return self.provider
-
-            # Fallback to instance provider
-            self.logger.info(f"No provider in metadata or storage with data, using instance provider: {self.provider}")
-            return self.provider
-
-        except Exception as e:
-            self.logger.warning(
-                f"Error reading provider from metadata: {e}, using instance provider"
-            )
-            return self.provider
+            if has_llamaindex:
+                self.logger.info(
+                    f"Detected LlamaIndex storage with data for '{kb_name}', using provider: llamaindex"
+                )
+                provider = "llamaindex"
+            elif has_rag:
+                self.logger.info(
+                    f"Detected RAG storage with data for '{kb_name}', using default provider: {self.provider}"
+                )
+                provider = self.provider
+
+        return KBStatus(
+            exists=True,
+            has_rag=has_rag,
+            has_llamaindex=has_llamaindex,
+            has_raw=has_raw,
+            provider=provider,
+        )
+
+    def _get_provider_for_kb(self, kb_name: str, kb_dir: Optional[Path] = None) -> str:
+        """
+        Get the RAG provider for a specific knowledge base from its metadata.
+        Falls back to instance provider or env var if not found in metadata.
+
+        Args:
+            kb_name: Knowledge base name
+            kb_dir: Pre-resolved KB directory, if the caller already built it
+
+        Returns:
+            Provider name (e.g., 'llamaindex', 'lightrag', 'raganything')
+        """
+        status = self._probe_kb_status(kb_name, kb_dir)
+        if status.provider:
+            return status.provider
+        self.logger.info(
+            f"No provider in metadata or storage with data, using instance provider: {self.provider}"
+        )
+        return self.provider
 
     async def delete(self, kb_name: str) -> bool:
         """
@@ -242,7 +354,7 @@ class RAGService:
             return await pipeline.delete(kb_name=kb_name)
 
         # Fallback: delete directory manually
-        kb_dir = Path(self.kb_base_dir) / kb_name
+        kb_dir = self._kb_base_path / kb_name
         if kb_dir.exists():
             shutil.rmtree(kb_dir)
             self.logger.info(f"Deleted KB directory: {kb_dir}")
@@ -11,6 +11,11 @@ import json
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 INTERFACE_SETTINGS_FILE = PROJECT_ROOT / "data" / "user" / "settings" / "interface.json"
 
@@ -19,50 +24,75 @@ DEFAULT_UI_SETTINGS: dict[str, Any] = {
     "language": "en",
 }
 
+# Accepted spellings -> canonical code; single dict lookup per call
+_LANG_MAP = {
+    "en": "en",
+    "english": "en",
+    "zh": "zh",
+    "chinese": "zh",
+    "cn": "zh",
+}
+
 
 def _normalize_language(language: Any, default: str = "en") -> str:
     """
     Normalize language codes:
     - en/english -> en
     - zh/chinese/cn -> zh
+
+    Unrecognized values fall back to the normalized default, then 'en'.
     """
-    if language is None or language == "":
-        language = default
+    if isinstance(default, str) and default:
+        fallback = _LANG_MAP.get(default.strip().lower(), "en")
+    else:
+        fallback = "en"
+    if not isinstance(language, str) or not language:
+        return fallback
+    return _LANG_MAP.get(language.strip().lower(), fallback)
 
-    if isinstance(language, str):
-        s = language.lower().strip()
-        if s in {"en", "english"}:
-            return "en"
-        if s in {"zh", "chinese", "cn"}:
-            return "zh"
 
-    # Fall back to default
-    if isinstance(default, str):
-        return _normalize_language(default, "en")
-    return "en"
+# (mtime_ns, parsed settings) for interface.json; request handlers call
+# get_ui_settings() repeatedly while the file only changes on user edits
+_settings_cache: tuple[int, dict[str, Any]] | None = None
 
 
 def get_ui_settings() -> dict[str, Any]:
     """
     Read UI settings from interface.json with defaults.
 
+    The parsed result is cached on the file's mtime, so steady-state
+    callers pay a single stat() instead of re-reading and re-parsing.
+
     Returns:
         dict containing at least: {"theme": "...", "language": "..."}
     """
-    if INTERFACE_SETTINGS_FILE.exists():
-        try:
+    global _settings_cache
+
+    try:
+        mtime_ns = INTERFACE_SETTINGS_FILE.stat().st_mtime_ns
+    except OSError:
+        return DEFAULT_UI_SETTINGS.copy()
+
+    if _settings_cache is not None and _settings_cache[0] == mtime_ns:
+        return dict(_settings_cache[1])
+
+    try:
+        if orjson is not None:
+            with open(INTERFACE_SETTINGS_FILE, "rb") as f:
+                saved = orjson.loads(f.read()) or {}
+        else:
             with open(INTERFACE_SETTINGS_FILE, encoding="utf-8") as f:
                 saved = json.load(f) or {}
-            merged = {**DEFAULT_UI_SETTINGS, **saved}
-            merged["language"] = _normalize_language(
-                merged.get("language"), DEFAULT_UI_SETTINGS["language"]
-            )
-            return merged
-        except Exception:
-            # On any parse error, fall back to defaults (safe)
-            return DEFAULT_UI_SETTINGS.copy()
-
-    return DEFAULT_UI_SETTINGS.copy()
+        merged = {**DEFAULT_UI_SETTINGS, **saved}
+        merged["language"] = _normalize_language(
+            merged.get("language"), DEFAULT_UI_SETTINGS["language"]
+        )
+    except Exception:
+        # On any parse error, fall back to defaults (safe)
+        merged = DEFAULT_UI_SETTINGS.copy()
+
+    _settings_cache = (mtime_ns, merged)
+    return dict(merged)
 
 
 def get_ui_language(default: str = "en") -> str:
@@ -1,30 +1,43 @@
 #!/usr/bin/env python3
 """Test script to verify brotli decompression is working with httpx and OpenAI client."""
 
-import httpx
-import brotli
+import importlib
+import sys
 
-print("✓ Testing brotli decompression support...")
-print(f"  - brotli version: {brotli.__version__}")
-print(f"  - httpx version: {httpx.__version__}")
+PROBES = [("brotli", "__version__"), ("httpx", "__version__")]
+
+lines = ["✓ Testing brotli decompression support..."]
+modules = {}
+for module_name, version_attr in PROBES:
+    try:
+        modules[module_name] = importlib.import_module(module_name)
+        lines.append(f"  - {module_name} version: {getattr(modules[module_name], version_attr)}")
+    except ImportError as e:
+        lines.append(f"  ✗ Failed to import {module_name}: {e}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.exit(1)
 
 # Test that httpx can handle brotli-compressed responses
-print("\n✓ Creating httpx client with brotli support...")
+lines.append("\n✓ Creating httpx client with brotli support...")
 try:
+    httpx = modules["httpx"]
     client = httpx.AsyncClient(
         limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
     )
-    print("  - httpx client created successfully")
-    print("  - Brotli decompression is available")
-    print("\n✓ The OpenAI client should now be able to handle brotli-compressed responses!")
-    print("  - You can now try your question generation again")
+    lines.append("  - httpx client created successfully")
+    lines.append("  - Brotli decompression is available")
+    lines.append("\n✓ The OpenAI client should now be able to handle brotli-compressed responses!")
+    lines.append("  - You can now try your question generation again")
 except Exception as e:
-    print(f"  ✗ Error: {e}")
+    lines.append(f"  ✗ Error: {e}")
 
-print("\n" + "="*60)
-print("NEXT STEPS:")
-print("="*60)
-print("1. Restart your backend server")
-print("2. Try generating questions again from your knowledge base")
-print("3. The 'Can not decode content-encoding: br' error should be resolved")
-print("="*60)
+lines += [
+    "\n" + "=" * 60,
+    "NEXT STEPS:",
+    "=" * 60,
+    "1. Restart your backend server",
+    "2. Try generating questions again from your knowledge base",
+    "3. The 'Can not decode content-encoding: br' error should be resolved",
+    "=" * 60,
+]
+sys.stdout.write("\n".join(lines) + "\n")
@@ -26,27 +26,31 @@ print(f"✓ httpx version: {httpx.__version__}")
 print(f"✓ openai version: {openai.__version__}")
 print()
 
-# Test httpx brotli support
-print("Testing httpx brotli support...")
-try:
-    http_client = httpx.AsyncClient(
-        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
-    )
-    print("✓ httpx AsyncClient created successfully")
-    print()
-except Exception as e:
-    print(f"✗ Error creating httpx client: {e}")
-    sys.exit(1)
 
-# Test OpenAI client
-print("Testing OpenAI client...")
-try:
+async def main():
+    """Run client setup and the API call on a single event loop."""
+    # Test httpx brotli support
+    print("Testing httpx brotli support...")
+    try:
+        from src.services.http import get_async_http_client
+
+        # Created inside the running loop so the pool is bound to it;
+        # shared client, closed by the factory at exit
+        http_client = get_async_http_client()
+        print("✓ Shared httpx AsyncClient created successfully")
+        print()
+    except Exception as e:
+        print(f"✗ Error creating httpx client: {e}")
+        return False
+
+    # Test OpenAI client
+    print("Testing OpenAI client...")
     api_key = os.getenv("LLM_API_KEY")
     base_url = os.getenv("LLM_HOST")
 
     if not api_key:
         print("✗ Error: LLM_API_KEY not set in .env file")
-        sys.exit(1)
+        return False
 
     print(f"  API endpoint: {base_url}")
 
@@ -61,39 +65,31 @@ try:
 
     # Test actual API call
     print("Testing API call with brotli decompression...")
+    try:
+        response = await client.chat.completions.create(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": "Say 'hello' in one word"}],
+            max_tokens=10,
+        )
+    except Exception as e:
+        print(f"✗ API call failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
 
-    async def test_call():
-        try:
-            response = await client.chat.completions.create(
-                model="gpt-4o",
-                messages=[{"role": "user", "content": "Say 'hello' in one word"}],
-                max_tokens=10,
-            )
-            return response
-        except Exception as e:
-            print(f"✗ API call failed: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
-
-    response = asyncio.run(test_call())
-
-    if response:
-        print("✓ API call successful!")
-        print(f"  Response: {response.choices[0].message.content}")
-        print()
-        print("=" * 60)
-        print("SUCCESS: Brotli decompression is working!")
-        print("=" * 60)
-    else:
+    print("✓ API call successful!")
+    print(f"  Response: {response.choices[0].message.content}")
+    print()
+    print("=" * 60)
+    print("SUCCESS: Brotli decompression is working!")
+    print("=" * 60)
+    return True
+
+
+if __name__ == "__main__":
+    if not asyncio.run(main()):
         print()
         print("=" * 60)
         print("FAILED: API call returned error")
         print("=" * 60)
         sys.exit(1)
-
-except Exception as e:
-    print(f"✗ Error: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
@@ -41,34 +41,19 @@ async def test_question_generation():
         traceback.print_exc()
         return False
 
-    # Test 2: Check RAG Service
-    print("\n[2] Testing RAG Search...")
-    try:
+    # Tests 2 and 3 are independent (both only need the KB), so run them
+    # concurrently and report in order once both finish
+    async def run_rag_search():
         from src.services.rag.service import RAGService
 
         service = RAGService()
-        result = await service.search(
+        return await service.search(
             kb_name=kb_name,
             query="What is a binary tree?",
             mode="hybrid"
         )
 
-        if result and result.get("answer"):
-            print(f"✓ RAG search successful")
-            print(f"  Answer preview: {result['answer'][:100]}...")
-        else:
-            print(f"✗ RAG search returned empty result: {result}")
-            return False
-
-    except Exception as e:
-        print(f"✗ RAG search failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-    # Test 3: Test RetrieveAgent
-    print("\n[3] Testing RetrieveAgent...")
-    try:
+    async def run_retrieve_agent():
         from src.agents.question.agents.retrieve_agent import RetrieveAgent
 
         retrieve_agent = RetrieveAgent(
@@ -83,24 +68,44 @@ async def test_question_generation():
             "question_type": "written"
         }
 
-        retrieval_result = await retrieve_agent.process(
+        return await retrieve_agent.process(
             requirement=requirement,
             num_queries=2
         )
 
-        print(f"✓ RetrieveAgent completed")
-        print(f"  Has content: {retrieval_result.get('has_content')}")
-        print(f"  Queries: {retrieval_result.get('queries', [])}")
+    print("\n[2+3] Testing RAG Search and RetrieveAgent concurrently...")
+    result, retrieval_result = await asyncio.gather(
+        run_rag_search(), run_retrieve_agent(), return_exceptions=True
+    )
 
-        if not retrieval_result.get("has_content"):
-            print(f"✗ No content retrieved!")
-            print(f"  Retrievals: {retrieval_result.get('retrievals', [])}")
-            return False
+    # Test 2: Check RAG Service
+    print("\n[2] RAG Search result...")
+    if isinstance(result, Exception):
+        print(f"✗ RAG search failed: {result}")
+        import traceback
+        traceback.print_exception(result)
+        return False
+    if result and result.get("answer"):
+        print(f"✓ RAG search successful")
+        print(f"  Answer preview: {result['answer'][:100]}...")
+    else:
+        print(f"✗ RAG search returned empty result: {result}")
+        return False
 
-    except Exception as e:
-        print(f"✗ RetrieveAgent failed: {e}")
+    # Test 3: Test RetrieveAgent
+    print("\n[3] RetrieveAgent result...")
+    if isinstance(retrieval_result, Exception):
+        print(f"✗ RetrieveAgent failed: {retrieval_result}")
         import traceback
-        traceback.print_exc()
+        traceback.print_exception(retrieval_result)
+        return False
+    print(f"✓ RetrieveAgent completed")
+    print(f"  Has content: {retrieval_result.get('has_content')}")
+    print(f"  Queries: {retrieval_result.get('queries', [])}")
+
+    if not retrieval_result.get("has_content"):
+        print(f"✗ No content retrieved!")
+        print(f"  Retrievals: {retrieval_result.get('retrievals', [])}")
         return False
 
     # Test 4: Test Full Question Generation
@@ -1,113 +1,217 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import heapq
+import mmap
+import os
 from pathlib import Path
+import sys
 import re
 from typing import Any, Iterable
 
+import pytest
 import yaml
 
+try:
+    # libyaml parses ~10x faster than the pure-Python loader with
+    # identical safe-loading semantics
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 AGENTS_DIR = PROJECT_ROOT / "src" / "agents"
 
 # Template placeholders are expected to be like {topic}, {knowledge_title}, etc.
 # Avoid false positives from LaTeX (\frac{1}{3}) and Mermaid (B{{Processing}}).
-PLACEHOLDER_RE = re.compile(r"(?<!\{)\{[A-Za-z_][A-Za-z0-9_]*\}(?!\})")
+_PLACEHOLDER_PATTERN = r"(?<!\{)\{[A-Za-z_][A-Za-z0-9_]*\}(?!\})"
+
+
+def _compile_placeholder_re():
+    # Prefer a DFA-based engine when one is installed; both are optional.
+    # The lookarounds are outside pure-re2 syntax, so compile defensively
+    # and fall back to stdlib re (pyre2 itself degrades to re for them).
+    for module_name in ("re2", "regex"):
+        try:
+            engine = __import__(module_name)
+            return engine.compile(_PLACEHOLDER_PATTERN)
+        except Exception:
+            continue
+    return re.compile(_PLACEHOLDER_PATTERN)
+
+
+PLACEHOLDER_RE = _compile_placeholder_re()
 
 
+@functools.lru_cache(maxsize=None)
+def _file_digest(path: Path) -> bytes:
+    """Fast content digest; byte-identical files are structurally identical."""
+    digest = hashlib.blake2b(digest_size=16, usedforsecurity=False)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+@functools.lru_cache(maxsize=None)
 def _load_yaml(path: Path) -> Any:
-    with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    # mmap hands libyaml the page cache directly, skipping the userspace
+    # read() copy, and libyaml does its own UTF-8 decoding. Empty files
+    # cannot be mapped and parse to {} anyway.
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return {}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return yaml.load(mm, Loader=_YamlLoader) or {}
 
 
 def _iter_yaml_files(root: Path) -> Iterable[Path]:
+    # scandir caches the dirent type, so is_dir/is_file don't re-stat the
+    # way rglob + p.is_file() do on every entry
     if not root.exists():
         return []
-    return sorted([p for p in root.rglob("*.yaml") if p.is_file()])
-
-
-def _get_placeholders(value: Any) -> set[str]:
-    found: set[str] = set()
-    if isinstance(value, str):
-        found |= set(PLACEHOLDER_RE.findall(value))
-    elif isinstance(value, dict):
-        for v in value.values():
-            found |= _get_placeholders(v)
-    elif isinstance(value, list):
-        for v in value:
-            found |= _get_placeholders(v)
-    return found
+    out: list[Path] = []
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".yaml") and entry.is_file(follow_symlinks=False):
+                    out.append(Path(entry.path))
+    out.sort()
+    return out
+
+
+def _walk(value: Any, prefix: str, keys: set[str], placeholders: set[str]) -> None:
+    """
+    Collect dotted key paths and string placeholders in one traversal.
+
+    A single explicit worklist (no per-node call frames, no RecursionError
+    on pathological nesting) feeds both result sets, which are mutated in
+    place instead of merged per level.
+    """
+    stack: list[tuple[Any, str]] = [(value, prefix)]
+    while stack:
+        v, p = stack.pop()
+        if isinstance(v, dict):
+            for k, sub in v.items():
+                # Interned: the same dotted paths recur across languages
+                # and modules, so set ops hash shared pointers
+                path = sys.intern(f"{p}.{k}" if p else str(k))
+                keys.add(path)
+                stack.append((sub, path))
+        elif isinstance(v, list):
+            # Lists are a key leaf (indices are not expanded), but their
+            # contents still contribute placeholders
+            if p:
+                keys.add(p)
+            _scan_placeholders(v, placeholders)
+        else:
+            if p:
+                keys.add(p)
+            if isinstance(v, str) and "{" in v:
+                # Cheap C-level gate: most prose leaves have no brace at
+                # all, so the regex engine never starts
+                for m in PLACEHOLDER_RE.finditer(v):
+                    placeholders.add(sys.intern(m.group()))
+
+
+def _scan_placeholders(value: Any, placeholders: set[str]) -> None:
+    stack: list[Any] = [value]
+    while stack:
+        v = stack.pop()
+        if isinstance(v, str):
+            if "{" in v:
+                for m in PLACEHOLDER_RE.finditer(v):
+                    placeholders.add(sys.intern(m.group()))
+        elif isinstance(v, dict):
+            stack.extend(v.values())
+        elif isinstance(v, list):
+            stack.extend(v)
+
+
+def _keys_and_placeholders(value: Any) -> tuple[set[str], set[str]]:
+    keys: set[str] = set()
+    placeholders: set[str] = set()
+    _walk(value, "", keys, placeholders)
+    return keys, placeholders
 
 
-def _collect_keys(value: Any, prefix: str = "") -> set[str]:
-    keys: set[str] = set()
-    if isinstance(value, dict):
-        for k, v in value.items():
-            path = f"{prefix}.{k}" if prefix else str(k)
-            keys.add(path)
-            keys |= _collect_keys(v, path)
-    elif isinstance(value, list):
-        if prefix:
-            keys.add(prefix)
-    else:
-        if prefix:
-            keys.add(prefix)
-    return keys
-
-
-def test_prompts_key_and_placeholder_parity():
-    assert AGENTS_DIR.exists(), f"Agents dir not found: {AGENTS_DIR}"
+@functools.lru_cache(maxsize=None)
+def _file_keys_and_placeholders(path: Path) -> tuple[frozenset[str], frozenset[str]]:
+    """Cached per-file walk: an en file compared against zh and cn is
+    parsed and traversed once."""
+    keys, placeholders = _keys_and_placeholders(_load_yaml(path))
+    return frozenset(keys), frozenset(placeholders)
 
-    failures: list[str] = []
 
+def _parity_cases() -> list:
+    """One case per (module, language, file); collected at import time so
+    pytest-xdist can shard the independent checks across workers."""
+    cases = []
+    if not AGENTS_DIR.exists():
+        return cases
     for module_dir in sorted([p for p in AGENTS_DIR.iterdir() if p.is_dir()]):
         prompts_dir = module_dir / "prompts"
         en_dir = prompts_dir / "en"
         if not en_dir.exists():
             continue
-
-        zh_dir = prompts_dir / "zh"
-        cn_dir = prompts_dir / "cn"
-
+        lang_dirs = [
+            (lang, prompts_dir / lang) for lang in ("zh", "cn") if (prompts_dir / lang).exists()
+        ]
         for en_file in _iter_yaml_files(en_dir):
             rel = en_file.relative_to(en_dir)
-            en_obj = _load_yaml(en_file)
-
-            candidates: list[tuple[str, Path]] = []
-            if zh_dir.exists():
-                candidates.append(("zh", zh_dir / rel))
-            if cn_dir.exists():
-                candidates.append(("cn", cn_dir / rel))
-
-            if not candidates:
-                continue
-
-            for lang_name, target_file in candidates:
-                if not target_file.exists():
-                    failures.append(f"[MISSING {lang_name}] {module_dir.name}: {rel.as_posix()}")
-                    continue
-
-                target_obj = _load_yaml(target_file)
-                en_keys = _collect_keys(en_obj)
-                target_keys = _collect_keys(target_obj)
-
-                missing = sorted(en_keys - target_keys)
-                extra = sorted(target_keys - en_keys)
-
-                en_ph = _get_placeholders(en_obj)
-                target_ph = _get_placeholders(target_obj)
-                ph_missing = sorted(en_ph - target_ph)
-                ph_extra = sorted(target_ph - en_ph)
-
-                if missing or extra or ph_missing or ph_extra:
-                    msg = [f"[DIFF {lang_name}] {module_dir.name}: {rel.as_posix()}"]
-                    if missing:
-                        msg.append("  missing keys: " + ", ".join(missing[:50]))
-                    if extra:
-                        msg.append("  extra keys: " + ", ".join(extra[:50]))
-                    if ph_missing:
-                        msg.append("  missing placeholders: " + ", ".join(ph_missing))
-                    if ph_extra:
-                        msg.append("  extra placeholders: " + ", ".join(ph_extra))
-                    failures.append("\n".join(msg))
-
-    assert not failures, "Prompt parity failures:\n" + "\n\n".join(failures)
+            for lang_name, lang_dir in lang_dirs:
+                cases.append(
+                    pytest.param(
+                        module_dir.name,
+                        lang_name,
+                        en_file,
+                        lang_dir / rel,
+                        id=f"{module_dir.name}-{lang_name}-{rel.as_posix()}",
+                    )
+                )
+    return cases
+
+
+def test_agents_dir_exists():
+    assert AGENTS_DIR.exists(), f"Agents dir not found: {AGENTS_DIR}"
+
+
+@pytest.mark.parametrize("module_name,lang_name,en_file,target_file", _parity_cases())
+def test_prompts_key_and_placeholder_parity(module_name, lang_name, en_file, target_file):
+    rel = en_file.as_posix().split("/prompts/en/", 1)[-1]
+    assert target_file.exists(), f"[MISSING {lang_name}] {module_name}: {rel}"
+
+    # Byte-identical files (tooling-synced translations) can't
+    # have key or placeholder drift: skip the parse entirely
+    if _file_digest(en_file) == _file_digest(target_file):
+        return
+
+    en_keys, en_ph = _file_keys_and_placeholders(en_file)
+    target_keys, target_ph = _file_keys_and_placeholders(target_file)
+
+    # Green path (the healthy-repo common case): equal sets
+    # mean there is no message to sort or format at all
+    if en_keys == target_keys and en_ph == target_ph:
+        return
+
+    msg = [f"[DIFF {lang_name}] {module_name}: {rel}"]
+    missing = en_keys - target_keys
+    if missing:
+        # Output is capped at 50 entries anyway: nsmallest is
+        # O(n log 50) vs sorting the whole diff
+        msg.append("  missing keys: " + ", ".join(heapq.nsmallest(50, missing)))
+    extra = target_keys - en_keys
+    if extra:
+        msg.append("  extra keys: " + ", ".join(heapq.nsmallest(50, extra)))
+    ph_missing = en_ph - target_ph
+    if ph_missing:
+        msg.append("  missing placeholders: " + ", ".join(sorted(ph_missing)))
+    ph_extra = target_ph - en_ph
+    if ph_extra:
+        msg.append("  extra placeholders: " + ", ".join(sorted(ph_extra)))
+    pytest.fail("\n".join(msg))
@@ -15,6 +15,8 @@ RAG Pipeline Integration Tests
     python tests/services/rag/test_rag_pipelines.py
 """
 
+import asyncio
+import functools
 import os
 from pathlib import Path
 import shutil
@@ -31,6 +33,46 @@ from dotenv import load_dotenv
 load_dotenv(project_root / "DeepTutor.env", override=False)
 load_dotenv(project_root / ".env", override=False)
 
+# Stable imports hoisted out of test bodies; only optional-dependency
+# imports (llamaindex) stay lazy inside their tests
+from src.services.rag.factory import get_pipeline, has_pipeline  # noqa: E402
+from src.services.rag.pipeline import RAGPipeline  # noqa: E402
+from src.services.rag.pipelines.raganything import RAGAnythingPipeline  # noqa: E402
+from src.tools.rag_tool import (  # noqa: E402
+    get_available_providers,
+    get_current_provider,
+    rag_search,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_pipeline(name: str):
+    """Share pipeline instances across read-only tests.
+
+    Construction loads parsers, chunkers, embedders, etc.; tests that only
+    inspect the pipeline reuse one instance. Tests that mutate pipeline
+    state (the full workflows patch kb_base_dir) must keep calling
+    get_pipeline directly.
+    """
+    return get_pipeline(name)
+
+
+# Shared fixture document: the content is identical for every test, so it
+# is written to disk once per module run instead of once per test method
+_shared_doc_dir: str | None = None
+_shared_doc: str | None = None
+
+
+def setUpModule():
+    global _shared_doc_dir, _shared_doc
+    _shared_doc_dir = tempfile.mkdtemp()
+    _shared_doc = RAGPipelineTestBase.create_test_document(_shared_doc_dir)
+
+
+def tearDownModule():
+    if _shared_doc_dir:
+        shutil.rmtree(_shared_doc_dir, ignore_errors=True)
+
 
 class RAGPipelineTestBase:
     """Base class for RAG pipeline tests"""
@@ -101,17 +143,17 @@ Machine learning has many applications in various fields including:
         return md_path
 
 
-class TestRAGToolIntegration(unittest.IsolatedAsyncioTestCase):
+class TestRAGToolIntegration(unittest.TestCase):
     """Test rag_tool.py interface with all pipelines"""
 
-    async def test_list_available_providers(self):
+    def test_list_available_providers(self):
         """Test listing available RAG providers"""
-        from src.tools.rag_tool import get_available_providers
-
         providers = get_available_providers()
-        print("\n=== Available RAG Providers ===")
-        for p in providers:
-            print(f"  - {p['id']}: {p['name']} - {p['description']}")
+        # One write instead of a print (stdout lock + flush) per provider
+        print(
+            "\n=== Available RAG Providers ===\n"
+            + "\n".join(f"  - {p['id']}: {p['name']} - {p['description']}" for p in providers)
+        )
 
         self.assertIsInstance(providers, list)
         self.assertGreater(len(providers), 0)
@@ -122,59 +164,45 @@ class TestRAGToolIntegration(unittest.IsolatedAsyncioTestCase):
         for expected_id in expected:
             self.assertIn(expected_id, provider_ids, f"Missing provider: {expected_id}")
 
-    async def test_get_current_provider(self):
+    def test_get_current_provider(self):
         """Test getting current RAG provider"""
-        from src.tools.rag_tool import get_current_provider
-
         provider = get_current_provider()
         print(f"\n=== Current Provider: {provider} ===")
 
         self.assertIsInstance(provider, str)
         self.assertIn(provider, ["raganything", "lightrag", "llamaindex"])
 
-    async def test_has_pipeline_valid(self):
+    def test_has_pipeline_valid(self):
         """Test has_pipeline with valid pipeline names"""
-        from src.services.rag.factory import has_pipeline
-
         for name in ["raganything", "lightrag", "llamaindex"]:
             self.assertTrue(has_pipeline(name), f"Pipeline {name} should exist")
 
-    async def test_has_pipeline_invalid(self):
+    def test_has_pipeline_invalid(self):
         """Test has_pipeline with invalid pipeline name"""
-        from src.services.rag.factory import has_pipeline
-
         self.assertFalse(has_pipeline("nonexistent"))
         self.assertFalse(has_pipeline(""))
 
 
-class TestPipelineFactory(unittest.IsolatedAsyncioTestCase):
+class TestPipelineFactory(unittest.TestCase):
     """Test pipeline factory functionality"""
 
-    async def test_get_pipeline_raganything(self):
+    def test_get_pipeline_raganything(self):
         """Test getting RAGAnything pipeline"""
-        from src.services.rag.factory import get_pipeline
-        from src.services.rag.pipelines.raganything import RAGAnythingPipeline
-
-        pipeline = get_pipeline("raganything")
+        pipeline = _cached_pipeline("raganything")
         self.assertIsInstance(pipeline, RAGAnythingPipeline)
         print(f"\n✓ RAGAnything pipeline created: {type(pipeline).__name__}")
 
-    async def test_get_pipeline_lightrag(self):
+    def test_get_pipeline_lightrag(self):
         """Test getting LightRAG pipeline"""
-        from src.services.rag.factory import get_pipeline
-        from src.services.rag.pipeline import RAGPipeline
-
-        pipeline = get_pipeline("lightrag")
+        pipeline = _cached_pipeline("lightrag")
         self.assertIsInstance(pipeline, RAGPipeline)
         self.assertEqual(pipeline.name, "lightrag")
         print(f"\n✓ LightRAG pipeline created: {pipeline.name}")
 
-    async def test_get_pipeline_llamaindex(self):
+    def test_get_pipeline_llamaindex(self):
         """Test getting LlamaIndex pipeline"""
-        from src.services.rag.factory import get_pipeline
-
         try:
-            pipeline = get_pipeline("llamaindex")
+            pipeline = _cached_pipeline("llamaindex")
         except ValueError as e:
             # Optional dependency may be missing in many installs
             self.skipTest(f"LlamaIndex not available (optional dependency missing): {e}")
@@ -185,10 +213,8 @@ class TestPipelineFactory(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(hasattr(pipeline, "delete"))
         print(f"\n✓ LlamaIndex pipeline created: {type(pipeline).__name__}")
 
-    async def test_get_pipeline_invalid(self):
+    def test_get_pipeline_invalid(self):
         """Test getting invalid pipeline raises error"""
-        from src.services.rag.factory import get_pipeline
-
         with self.assertRaises(ValueError) as context:
             get_pipeline("nonexistent")
 
@@ -199,24 +225,29 @@ class TestPipelineFactory(unittest.IsolatedAsyncioTestCase):
 class TestRAGAnythingPipeline(unittest.IsolatedAsyncioTestCase, RAGPipelineTestBase):
     """Test RAGAnything pipeline (requires RAG-Anything library)"""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._tmp_root = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        # One rmtree for the whole class beats one per test
+        shutil.rmtree(cls._tmp_root, ignore_errors=True)
+        super().tearDownClass()
+
     def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_doc = self.create_test_document(self.temp_dir)
+        """Set up test fixtures (per-test dir inside the class temp root)"""
+        self.temp_dir = tempfile.mkdtemp(dir=self._tmp_root)
+        self.test_doc = _shared_doc
         self.test_kb_dir = os.path.join(self.temp_dir, "knowledge_bases")
         os.makedirs(self.test_kb_dir, exist_ok=True)
 
-    def tearDown(self):
-        """Clean up test fixtures"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     async def test_raganything_availability(self):
         """Test if RAGAnything dependencies are available"""
         print("\n=== Testing RAGAnything Availability ===")
 
         try:
-            from src.services.rag.pipelines.raganything import RAGAnythingPipeline
-
             pipeline = RAGAnythingPipeline(kb_base_dir=self.test_kb_dir)
             print("✓ RAGAnythingPipeline class available")
 
@@ -244,8 +275,6 @@ class TestRAGAnythingPipeline(unittest.IsolatedAsyncioTestCase, RAGPipelineTestB
         """Test RAGAnything full workflow: initialize -> search -> delete"""
         print("\n=== Testing RAGAnything Full Workflow ===")
 
-        from src.services.rag.pipelines.raganything import RAGAnythingPipeline
-
         pipeline = RAGAnythingPipeline(kb_base_dir=self.test_kb_dir)
 
         # Test initialization
@@ -276,25 +305,30 @@ class TestRAGAnythingPipeline(unittest.IsolatedAsyncioTestCase, RAGPipelineTestB
 class TestLlamaIndexPipeline(unittest.IsolatedAsyncioTestCase, RAGPipelineTestBase):
     """Test LlamaIndex pipeline (lightweight implementation)"""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._tmp_root = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        # One rmtree for the whole class beats one per test
+        shutil.rmtree(cls._tmp_root, ignore_errors=True)
+        super().tearDownClass()
+
     def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_doc = self.create_test_document(self.temp_dir)
+        """Set up test fixtures (per-test dir inside the class temp root)"""
+        self.temp_dir = tempfile.mkdtemp(dir=self._tmp_root)
+        self.test_doc = _shared_doc
         self.test_kb_dir = os.path.join(self.temp_dir, "knowledge_bases")
         os.makedirs(self.test_kb_dir, exist_ok=True)
 
-    def tearDown(self):
-        """Clean up test fixtures"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     async def test_llamaindex_components(self):
         """Test LlamaIndex pipeline components are properly configured"""
         print("\n=== Testing LlamaIndex Pipeline Components ===")
 
-        from src.services.rag.factory import get_pipeline
-
         try:
-            pipeline = get_pipeline("llamaindex")
+            pipeline = _cached_pipeline("llamaindex")
         except ValueError as e:
             self.skipTest(f"LlamaIndex not available (optional dependency missing): {e}")
 
@@ -313,8 +347,6 @@ class TestLlamaIndexPipeline(unittest.IsolatedAsyncioTestCase, RAGPipelineTestBa
         """Test LlamaIndex pipeline full workflow"""
         print("\n=== Testing LlamaIndex Full Workflow ===")
 
-        from src.services.rag.factory import get_pipeline
-
         pipeline = get_pipeline("llamaindex")
 
         # Patch the kb_base_dir for indexer and retriever
@@ -341,16 +373,14 @@ class TestLlamaIndexPipeline(unittest.IsolatedAsyncioTestCase, RAGPipelineTestBa
         print(f"✓ Search result: {result.get('answer', '')[:100]}...")
 
 
-class TestLightRAGPipeline(unittest.IsolatedAsyncioTestCase, RAGPipelineTestBase):
+class TestLightRAGPipeline(unittest.TestCase, RAGPipelineTestBase):
     """Test LightRAG pipeline (requires RAG-Anything)"""
 
-    async def test_lightrag_components(self):
+    def test_lightrag_components(self):
         """Test LightRAG pipeline components are properly configured"""
         print("\n=== Testing LightRAG Pipeline Components ===")
 
-        from src.services.rag.factory import get_pipeline
-
-        pipeline = get_pipeline("lightrag")
+        pipeline = _cached_pipeline("lightrag")
 
         # Check components
         self.assertIsNotNone(pipeline._parser)
@@ -372,21 +402,26 @@ class TestLightRAGPipeline(unittest.IsolatedAsyncioTestCase, RAGPipelineTestBase
 class TestRAGToolWithProviders(unittest.IsolatedAsyncioTestCase, RAGPipelineTestBase):
     """Test rag_tool.py with different providers"""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._tmp_root = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        # One rmtree for the whole class beats one per test
+        shutil.rmtree(cls._tmp_root, ignore_errors=True)
+        super().tearDownClass()
+
     def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_doc = self.create_test_document(self.temp_dir)
+        """Set up test fixtures (per-test dir inside the class temp root)"""
+        self.temp_dir = tempfile.mkdtemp(dir=self._tmp_root)
+        self.test_doc = _shared_doc
         self.test_kb_dir = os.path.join(self.temp_dir, "knowledge_bases")
         os.makedirs(self.test_kb_dir, exist_ok=True)
 
-    def tearDown(self):
-        """Clean up test fixtures"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     async def test_rag_search_invalid_provider(self):
         """Test rag_search with invalid provider raises error"""
-        from src.tools.rag_tool import rag_search
-
         print("\n=== Testing Invalid Provider Error ===")
 
         with self.assertRaises(ValueError) as context:
@@ -399,7 +434,9 @@ class TestRAGToolWithProviders(unittest.IsolatedAsyncioTestCase, RAGPipelineTest
 
     async def test_rag_search_default_provider(self):
         """Test rag_search uses default provider from env"""
-        from src.tools.rag_tool import DEFAULT_RAG_PROVIDER, get_current_provider
+        # Stays lazy: DEFAULT_RAG_PROVIDER is not currently exported by
+        # rag_tool, and this test documents that gap when it runs
+        from src.tools.rag_tool import DEFAULT_RAG_PROVIDER
 
         print("\n=== Testing Default Provider ===")
 
@@ -414,69 +451,42 @@ class TestRAGToolWithProviders(unittest.IsolatedAsyncioTestCase, RAGPipelineTest
 class TestComponentAvailability(unittest.IsolatedAsyncioTestCase):
     """Test individual component availability"""
 
-    async def test_parsers_available(self):
-        """Test all parsers can be imported"""
-        print("\n=== Testing Parser Availability ===")
-
-        from src.services.rag.components.parsers import MarkdownParser, PDFParser
-
-        pdf_parser = PDFParser()
-        print(f"✓ PDFParser: {pdf_parser.name}")
-
-        md_parser = MarkdownParser()
-        print(f"✓ MarkdownParser: {md_parser.name}")
-
-    async def test_chunkers_available(self):
-        """Test all chunkers can be imported"""
-        print("\n=== Testing Chunker Availability ===")
+    async def test_components_available(self):
+        """Test all pipeline components can be imported and instantiated"""
+        print("\n=== Testing Component Availability ===")
 
         from src.services.rag.components.chunkers import (
             FixedSizeChunker,
             NumberedItemExtractor,
             SemanticChunker,
         )
-
-        semantic = SemanticChunker()
-        print(f"✓ SemanticChunker: {semantic.name}")
-
-        fixed = FixedSizeChunker()
-        print(f"✓ FixedSizeChunker: {fixed.name}")
-
-        numbered = NumberedItemExtractor()
-        print(f"✓ NumberedItemExtractor: {numbered.name}")
-
-    async def test_embedders_available(self):
-        """Test all embedders can be imported"""
-        print("\n=== Testing Embedder Availability ===")
-
         from src.services.rag.components.embedders import OpenAIEmbedder
-
-        embedder = OpenAIEmbedder()
-        print(f"✓ OpenAIEmbedder: {embedder.name}")
-
-    async def test_indexers_available(self):
-        """Test all indexers can be imported"""
-        print("\n=== Testing Indexer Availability ===")
-
         from src.services.rag.components.indexers import GraphIndexer, VectorIndexer
-
-        vector = VectorIndexer()
-        print(f"✓ VectorIndexer: {vector.name}")
-
-        graph = GraphIndexer()
-        print(f"✓ GraphIndexer: {graph.name}")
-
-    async def test_retrievers_available(self):
-        """Test all retrievers can be imported"""
-        print("\n=== Testing Retriever Availability ===")
-
+        from src.services.rag.components.parsers import MarkdownParser, PDFParser
         from src.services.rag.components.retrievers import DenseRetriever, HybridRetriever
 
-        dense = DenseRetriever()
-        print(f"✓ DenseRetriever: {dense.name}")
+        # Instantiations are independent: overlap any blocking setup work
+        # instead of paying five sequential test setup/teardown cycles
+        factories = [
+            PDFParser,
+            MarkdownParser,
+            SemanticChunker,
+            FixedSizeChunker,
+            NumberedItemExtractor,
+            OpenAIEmbedder,
+            VectorIndexer,
+            GraphIndexer,
+            DenseRetriever,
+            HybridRetriever,
+        ]
+        components = await asyncio.gather(
+            *(asyncio.to_thread(factory) for factory in factories)
+        )
 
-        hybrid = HybridRetriever()
-        print(f"✓ HybridRetriever: {hybrid.name}")
+        print(
+            "\n".join(f"✓ {type(component).__name__}: {component.name}" for component in components)
+        )
+        self.assertEqual(len(components), len(factories))
 
 
 class TestExistingKnowledgeBase(unittest.IsolatedAsyncioTestCase):
@@ -490,8 +500,6 @@ class TestExistingKnowledgeBase(unittest.IsolatedAsyncioTestCase):
         """Test search on an existing knowledge base"""
         print("\n=== Testing Existing Knowledge Base ===")
 
-        from src.tools.rag_tool import rag_search
-
         # Use default or specified KB
         kb_name = os.environ.get("TEST_KB_NAME", "ai-textbook")
         query = os.environ.get("TEST_QUERY", "What is machine learning?")